@@ -1,29 +1,70 @@
 from __future__ import annotations
 
-import json
+import heapq
 import time
 from typing import Any
 
+from app import jsonutil
+
 
 class TTLCache:
-    def __init__(self) -> None:
-        self._store: dict[str, tuple[float, Any]] = {}
+    def __init__(self, maxsize: int = 1024) -> None:
+        self._maxsize = maxsize
+        # key -> (expires_at, fresh_until, value); entries past fresh_until are stale but still servable.
+        self._store: dict[str, tuple[float, float, Any]] = {}
+        self._expiry: list[tuple[float, str]] = []
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._store)
 
     def get(self, key: str) -> Any | None:
-        item = self._store.get(key)
-        if not item:
+        try:
+            expires_at, fresh_until, value = self._store[key]
+        except KeyError:
             return None
-        expires_at, value = item
-        if expires_at < time.time():
-            self._store.pop(key, None)
+        now = time.monotonic()
+        if fresh_until < now:
+            if expires_at < now:
+                self._store.pop(key, None)
             return None
         return value
 
-    def set(self, key: str, value: Any, ttl_seconds: int) -> None:
-        expires_at = time.time() + ttl_seconds
-        self._store[key] = (expires_at, value)
+    def get_with_meta(self, key: str) -> tuple[Any, float] | None:
+        try:
+            expires_at, fresh_until, value = self._store[key]
+        except KeyError:
+            return None
+        if expires_at < time.monotonic():
+            self._store.pop(key, None)
+            return None
+        return value, fresh_until
+
+    def set(self, key: str, value: Any, ttl_seconds: int, stale_seconds: int = 0) -> None:
+        now = time.monotonic()
+        fresh_until = now + ttl_seconds
+        expires_at = fresh_until + stale_seconds
+        self._store[key] = (expires_at, fresh_until, value)
+        heapq.heappush(self._expiry, (expires_at, key))
+        self._evict(now)
+
+    def bump_version(self) -> int:
+        # Keys embed the version, so bumping it orphans every existing entry without a scan;
+        # the orphans age out through the normal expiry sweep.
+        self.version += 1
+        return self.version
+
+    def _evict(self, now: float) -> None:
+        # Heap entries can be stale (key overwritten or already dropped by get); only delete
+        # the store entry when its expiry still matches the one recorded in the heap.
+        expiry = self._expiry
+        while expiry and (expiry[0][0] < now or len(self._store) > self._maxsize):
+            expires_at, key = heapq.heappop(expiry)
+            item = self._store.get(key)
+            if item is not None and item[0] == expires_at:
+                del self._store[key]
 
 
-def make_cache_key(route_name: str, params: dict[str, Any], mode: str) -> str:
-    payload = json.dumps(params, sort_keys=True, separators=(",", ":"))
-    return f"{route_name}:{mode}:{payload}"
+def make_cache_key(route_name: str, params: dict[str, Any], mode: str, version: int = 0) -> str:
+    payload = jsonutil.dumps(params, sort_keys=True).decode("utf-8")
+    return f"{route_name}:{mode}:v{version}:{payload}"
@@ -1,14 +1,43 @@
 from __future__ import annotations
 
-from fastapi import Header
+import hmac
+from functools import lru_cache
+from typing import Awaitable, Callable
 
-from app.errors import APIError
+from fastapi import Request
+from fastapi.responses import Response
+from fastapi.security import APIKeyHeader
+
+from app.errors import APIError, error_response
 from app.settings import get_settings
 
+# FastAPI's default docs routes were never covered by the app-level key dependency; keep them open.
+PUBLIC_PATHS = frozenset({"/docs", "/docs/oauth2-redirect", "/redoc", "/openapi.json"})
+
+
+@lru_cache(maxsize=4)
+def _encoded_key(api_key: str) -> bytes:
+    return api_key.encode("utf-8")
+
 
-def api_key_guard(x_api_key: str | None = Header(default=None, alias="X-API-Key")) -> None:
-    settings = get_settings()
+def check_api_key(x_api_key: str | None) -> None:
     if not x_api_key:
         raise APIError(401, "missing_api_key", "X-API-Key header is required")
-    if x_api_key != settings.api_key:
+    expected = _encoded_key(get_settings().api_key)
+    if not hmac.compare_digest(x_api_key.encode("utf-8"), expected):
         raise APIError(403, "invalid_api_key", "X-API-Key is invalid")
+
+
+# Documents the header in OpenAPI only; api_key_middleware does the enforcing.
+api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
+
+
+async def api_key_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    if request.url.path not in PUBLIC_PATHS:
+        try:
+            check_api_key(request.headers.get("x-api-key"))
+        except APIError as exc:
+            return error_response(exc.status_code, exc.code, exc.message, exc.detail)
+    return await call_next(request)
@@ -4,20 +4,26 @@ from typing import Any
 
 from fastapi import HTTPException, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
 
+from app.models import ResponseModel
+from app.responses import ORJSONResponse
 
-class ErrorDetail(BaseModel):
+
+class ErrorDetail(ResponseModel):
     code: str
     message: str
     detail: str | None = None
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(ResponseModel):
     error: ErrorDetail
 
 
+ERROR_RESPONSES: dict[int | str, dict[str, Any]] = {
+    status: {"model": ErrorResponse} for status in (400, 401, 403, 502, 503, 504)
+}
+
+
 class APIError(Exception):
     def __init__(self, status_code: int, code: str, message: str, detail: str | None = None) -> None:
         self.status_code = status_code
@@ -40,53 +46,39 @@ class UpstreamTimeout(Exception):
 
 
 def _payload(code: str, message: str, detail: str | None) -> dict[str, Any]:
-    return ErrorResponse(error=ErrorDetail(code=code, message=message, detail=detail)).model_dump()
+    return {"error": {"code": code, "message": message, "detail": detail}}
+
+
+def error_response(status_code: int, code: str, message: str, detail: str | None = None) -> ORJSONResponse:
+    return ORJSONResponse(status_code=status_code, content=_payload(code, message, detail))
 
 
-def api_error_handler(_: Request, exc: APIError) -> JSONResponse:
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=_payload(exc.code, exc.message, exc.detail),
-    )
+def api_error_handler(_: Request, exc: APIError) -> ORJSONResponse:
+    return error_response(exc.status_code, exc.code, exc.message, exc.detail)
 
 
-def http_exception_handler(_: Request, exc: HTTPException) -> JSONResponse:
+def http_exception_handler(_: Request, exc: HTTPException) -> ORJSONResponse:
     detail = exc.detail if isinstance(exc.detail, str) else None
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=_payload("http_error", "Request failed", detail),
-    )
+    return error_response(exc.status_code, "http_error", "Request failed", detail)
 
 
-def validation_exception_handler(_: Request, exc: RequestValidationError) -> JSONResponse:
-    return JSONResponse(
-        status_code=400,
-        content=_payload("invalid_request", "Invalid request", str(exc)),
-    )
+def validation_exception_handler(_: Request, exc: RequestValidationError) -> ORJSONResponse:
+    return error_response(400, "invalid_request", "Invalid request", str(exc))
 
 
-def missing_auth_handler(_: Request, exc: MissingGarminAuth) -> JSONResponse:
+def missing_auth_handler(_: Request, exc: MissingGarminAuth) -> ORJSONResponse:
     detail = str(exc) if str(exc) else None
-    return JSONResponse(
-        status_code=503,
-        content=_payload("needs_login", "Garmin authentication required", detail),
-    )
+    return error_response(503, "needs_login", "Garmin authentication required", detail)
 
 
-def garmin_auth_failure_handler(_: Request, exc: GarminAuthFailure) -> JSONResponse:
+def garmin_auth_failure_handler(_: Request, exc: GarminAuthFailure) -> ORJSONResponse:
     detail = str(exc) if str(exc) else None
-    return JSONResponse(
-        status_code=502,
-        content=_payload("garmin_auth_failure", "Garmin authentication failed", detail),
-    )
+    return error_response(502, "garmin_auth_failure", "Garmin authentication failed", detail)
 
 
-def upstream_timeout_handler(_: Request, exc: UpstreamTimeout) -> JSONResponse:
+def upstream_timeout_handler(_: Request, exc: UpstreamTimeout) -> ORJSONResponse:
     detail = str(exc) if str(exc) else None
-    return JSONResponse(
-        status_code=504,
-        content=_payload("upstream_timeout", "Garmin request timed out", detail),
-    )
+    return error_response(504, "upstream_timeout", "Garmin request timed out", detail)
 
 
 def register_exception_handlers(app: Any) -> None:
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import os
 import random
 import time
+import zlib
+from contextlib import suppress
 from dataclasses import dataclass
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from functools import lru_cache
-from typing import Any, Callable, TypeVar
+from typing import Any, AsyncIterator, Awaitable, Callable, TypeVar
 
+from app import jsonutil
 from app.errors import GarminAuthFailure, MissingGarminAuth, UpstreamTimeout
 from app.settings import get_settings
 
@@ -38,18 +41,92 @@ try:
 except ImportError:  # pragma: no cover
     GarminConnectTooManyRequestsError = Exception  # type: ignore[assignment]
 
+RETRYABLE_ERRORS = (
+    GarminConnectTimeoutError,
+    GarminConnectConnectionError,
+    GarminConnectTooManyRequestsError,
+    TimeoutError,
+)
+
 TOKEN_FILE = "token.json"
+TOKEN_BUNDLE_FILE = "token.bin"
+TOKEN_BUNDLE_VERSION = 1
 META_FILE = "token_meta.json"
+MAX_CONCURRENT_FETCHES = 8
+ACTIVITIES_PAGE_SIZE = 50
+ACTIVITIES_MAX_PAGES = 20
+ACTIVITIES_PAGE_WINDOW = 4
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5
+ENDPOINT_METHODS: dict[str, tuple[str, ...]] = {
+    "activities": ("get_activities",),
+    "activity_detail": ("get_activity_details", "get_activity_detail"),
+    "stats": ("get_stats", "get_daily_summary", "get_steps_data"),
+    "sleep": ("get_sleep_data",),
+    "stress": ("get_stress_data",),
+    "body_battery": ("get_body_battery",),
+    "hrv": ("get_hrv_data",),
+    "intensity_minutes": ("get_intensity_minutes",),
+    "weight": ("get_weight_data",),
+}
 logger = logging.getLogger("garmin-service")
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=8192)
+def _parse_iso_date(head: str) -> date | None:
+    try:
+        return date.fromisoformat(head)
+    except ValueError:
+        return None
+
+
+def _resolve_endpoints(client: Any) -> dict[str, Callable[..., Any] | None]:
+    endpoints: dict[str, Callable[..., Any] | None] = {}
+    for name, candidates in ENDPOINT_METHODS.items():
+        endpoints[name] = None
+        for method_name in candidates:
+            method = getattr(client, method_name, None)
+            if method is not None:
+                endpoints[name] = method
+                break
+    return endpoints
+
+
+@lru_cache(maxsize=None)
+def _restore_method(garth_type: type) -> str | None:
+    for name in ("restore", "loads", "load"):
+        if hasattr(garth_type, name):
+            return name
+    return None
+
+
+def _encode_token_bundle(payload: dict[str, Any]) -> bytes:
+    return bytes((TOKEN_BUNDLE_VERSION,)) + zlib.compress(jsonutil.dumps(payload))
+
+
+def _decode_token_bundle(data: bytes) -> Any:
+    if not data or data[0] != TOKEN_BUNDLE_VERSION:
+        raise ValueError("Unsupported token bundle format")
+    try:
+        return jsonutil.loads(zlib.decompress(data[1:]))
+    except zlib.error as exc:
+        raise ValueError(str(exc)) from exc
+
+
 @dataclass
 class _TokenBundle:
     data: dict[str, Any]
 
 
 class GarminClientWrapper:
+    _garmin: Garmin | None = None
+    _token_dir_ready = False
+    _legacy_token_file = False
+    _fetch_semaphore: asyncio.Semaphore | None = None
+    _fetch_loop: asyncio.AbstractEventLoop | None = None
+    _api: dict[str, Callable[..., Any] | None]
+
     def __init__(self) -> None:
         settings = get_settings()
         self._token_dir = settings.token_dir
@@ -59,9 +136,21 @@ class GarminClientWrapper:
         self.token_last_refresh: datetime | None = None
         self._tokens: _TokenBundle | None = None
         self._client: Garmin | None = None
+        self._refresh_lock = asyncio.Lock()
+        self._inflight: dict[tuple[Any, ...], asyncio.Future[Any]] = {}
+        self._refresh_interval = timedelta(seconds=settings.token_refresh_interval_seconds)
 
         self._initialize_tokens()
 
+    @property
+    def _client(self) -> Garmin | None:
+        return self._garmin
+
+    @_client.setter
+    def _client(self, client: Garmin | None) -> None:
+        self._garmin = client
+        self._api = _resolve_endpoints(client)
+
     def auth_status(self) -> str:
         return self._auth_status
 
@@ -69,104 +158,236 @@ class GarminClientWrapper:
         if self._auth_status != "ok":
             raise MissingGarminAuth()
 
-    def get_activities(self, start: date, end: date, activity_type: str | None) -> list[dict[str, Any]]:
-        client = self._client_or_raise()
-        data: list[dict[str, Any]] = []
-        if not hasattr(client, "get_activities"):
-            return []
-
-        limit = 50
-        max_pages = 20
-        for page in range(max_pages):
-            offset = page * limit
-            batch = self._with_retries(lambda: client.get_activities(offset, limit))
-            if not isinstance(batch, list) or not batch:
-                break
-            data.extend(batch)
-            oldest = self._oldest_activity_date(batch)
-            if oldest and oldest < start:
-                break
-
-        filtered = self._filter_activities_by_date(data, start, end)
-        if activity_type:
-            activity_type = activity_type.lower()
-            filtered = [
-                activity for activity in filtered if self._activity_type(activity).lower() == activity_type
-            ]
-        return filtered
-
     def get_activity_detail(self, activity_id: str) -> dict[str, Any]:
-        client = self._client_or_raise()
-        if hasattr(client, "get_activity_details"):
-            return self._with_retries(lambda: client.get_activity_details(activity_id))
-        if hasattr(client, "get_activity_detail"):
-            return self._with_retries(lambda: client.get_activity_detail(activity_id))
-        raise RuntimeError("Activity detail endpoint is unavailable")
+        fetch = self._endpoint("activity_detail")
+        if fetch is None:
+            raise RuntimeError("Activity detail endpoint is unavailable")
+        return self._with_retries(fetch, activity_id)
 
     def get_daily_stats(self, target_date: date) -> dict[str, Any] | None:
-        client = self._client_or_raise()
-        date_str = target_date.isoformat()
-        if hasattr(client, "get_stats"):
-            return self._with_retries(lambda: client.get_stats(date_str))
-        if hasattr(client, "get_daily_summary"):
-            return self._with_retries(lambda: client.get_daily_summary(date_str))
-        if hasattr(client, "get_steps_data"):
-            return self._with_retries(lambda: client.get_steps_data(date_str))
-        return None
+        return self._fetch_for_date("stats", target_date)
 
     def get_sleep_summary(self, target_date: date) -> dict[str, Any] | None:
-        client = self._client_or_raise()
-        date_str = target_date.isoformat()
-        if hasattr(client, "get_sleep_data"):
-            return self._with_retries(lambda: client.get_sleep_data(date_str))
-        return None
+        return self._fetch_for_date("sleep", target_date)
 
     def get_stress_summary(self, target_date: date) -> dict[str, Any] | None:
-        client = self._client_or_raise()
-        date_str = target_date.isoformat()
-        if hasattr(client, "get_stress_data"):
-            return self._with_retries(lambda: client.get_stress_data(date_str))
-        return None
+        return self._fetch_for_date("stress", target_date)
 
     def get_body_battery_summary(self, target_date: date) -> dict[str, Any] | None:
-        client = self._client_or_raise()
-        date_str = target_date.isoformat()
-        if hasattr(client, "get_body_battery"):
-            return self._with_retries(lambda: client.get_body_battery(date_str))
-        return None
+        return self._fetch_for_date("body_battery", target_date)
 
     def get_hrv_summary(self, target_date: date) -> dict[str, Any] | None:
-        client = self._client_or_raise()
-        date_str = target_date.isoformat()
-        if hasattr(client, "get_hrv_data"):
-            return self._with_retries(lambda: client.get_hrv_data(date_str))
-        return None
+        return self._fetch_for_date("hrv", target_date)
 
     def get_intensity_minutes_summary(self, target_date: date) -> dict[str, Any] | None:
-        client = self._client_or_raise()
-        date_str = target_date.isoformat()
-        if hasattr(client, "get_intensity_minutes"):
-            return self._with_retries(lambda: client.get_intensity_minutes(date_str))
-        return None
+        return self._fetch_for_date("intensity_minutes", target_date)
 
     def get_weight_range(self, start: date, end: date) -> list[dict[str, Any]]:
-        client = self._client_or_raise()
-        start_str = start.isoformat()
-        end_str = end.isoformat()
-        if hasattr(client, "get_weight_data"):
-            data = self._with_retries(lambda: client.get_weight_data(start_str, end_str))
-            if isinstance(data, list):
-                return data
-            if isinstance(data, dict):
-                return data.get("weightSamples", [])
+        fetch = self._endpoint("weight")
+        if fetch is None:
+            return []
+        data = self._with_retries(fetch, start.isoformat(), end.isoformat())
+        if isinstance(data, list):
+            return data
+        if isinstance(data, dict):
+            return data.get("weightSamples", [])
         return []
 
+    async def aget_activities(
+        self, start: date, end: date, activity_type: str | None
+    ) -> list[dict[str, Any]]:
+        fetch = self._endpoint("activities")
+        data: list[dict[str, Any]] = []
+        if fetch is None:
+            return []
+
+        # Most windows fit in the first page, so probe it alone before fanning out.
+        first = await self._single_flight(("activities", 0), self._fetch_activities_page, fetch, 0)
+        if not self._extend_activities(data, first, start):
+            return self._select_activities(data, start, end, activity_type)
+
+        for first_page in range(1, ACTIVITIES_MAX_PAGES, ACTIVITIES_PAGE_WINDOW):
+            pages = range(first_page, min(first_page + ACTIVITIES_PAGE_WINDOW, ACTIVITIES_MAX_PAGES))
+            batches = await asyncio.gather(
+                *(
+                    self._single_flight(
+                        ("activities", page), self._fetch_activities_page, fetch, page
+                    )
+                    for page in pages
+                )
+            )
+            if not all(self._extend_activities(data, batch, start) for batch in batches):
+                break
+        return self._select_activities(data, start, end, activity_type)
+
+    async def aget_daily_stats(self, target_date: date) -> dict[str, Any] | None:
+        return await self._single_flight(("stats", target_date), self.get_daily_stats, target_date)
+
+    async def aget_sleep_summary(self, target_date: date) -> dict[str, Any] | None:
+        return await self._single_flight(("sleep", target_date), self.get_sleep_summary, target_date)
+
+    async def aget_stress_summary(self, target_date: date) -> dict[str, Any] | None:
+        return await self._single_flight(("stress", target_date), self.get_stress_summary, target_date)
+
+    async def aget_body_battery_summary(self, target_date: date) -> dict[str, Any] | None:
+        return await self._single_flight(
+            ("body_battery", target_date), self.get_body_battery_summary, target_date
+        )
+
+    async def aget_hrv_summary(self, target_date: date) -> dict[str, Any] | None:
+        return await self._single_flight(("hrv", target_date), self.get_hrv_summary, target_date)
+
+    async def aget_intensity_minutes_summary(self, target_date: date) -> dict[str, Any] | None:
+        return await self._single_flight(
+            ("intensity_minutes", target_date), self.get_intensity_minutes_summary, target_date
+        )
+
+    async def aget_weight_range(self, start: date, end: date) -> list[dict[str, Any]]:
+        return await self._single_flight(("weight", start, end), self.get_weight_range, start, end)
+
+    async def _single_flight(self, key: tuple[Any, ...], func: Callable[..., T], *args: Any) -> T:
+        # Concurrent callers asking for the same upstream data share one worker-thread call.
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._bounded_call(func, *args))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _bounded_call(self, func: Callable[..., T], *args: Any) -> T:
+        async with self._fetch_slots():
+            return await asyncio.to_thread(func, *args)
+
+    def _fetch_slots(self) -> asyncio.Semaphore:
+        # One semaphore per wrapper caps upstream calls across all requests; it is rebuilt if the
+        # running loop changes because a semaphore cannot be shared between loops.
+        loop = asyncio.get_running_loop()
+        if self._fetch_semaphore is None or self._fetch_loop is not loop:
+            self._fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+            self._fetch_loop = loop
+        return self._fetch_semaphore
+
+    async def aget_daily_bundle(self, dates: list[date]) -> list[dict[str, Any]]:
+        fetch_day = self._daily_fetcher()
+        days = await asyncio.gather(*(fetch_day(target_date) for target_date in dates))
+        return [bundle for _, bundle in days]
+
+    async def aiter_daily_bundles(self, dates: list[date]) -> AsyncIterator[tuple[date, dict[str, Any]]]:
+        fetch_day = self._daily_fetcher()
+        tasks = [asyncio.ensure_future(fetch_day(target_date)) for target_date in dates]
+        try:
+            for next_day in asyncio.as_completed(tasks):
+                yield await next_day
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _daily_fetcher(self) -> Callable[[date], Awaitable[tuple[date, dict[str, Any]]]]:
+        # Concurrency is bounded per upstream call in _single_flight, not per day or source.
+        sources = self._daily_sources()
+        keys = [key for key, _ in sources]
+
+        async def fetch_day(target_date: date) -> tuple[date, dict[str, Any]]:
+            results = await asyncio.gather(*(source(target_date) for _, source in sources))
+            return target_date, dict(zip(keys, results))
+
+        return fetch_day
+
+    def _daily_sources(self) -> tuple[tuple[str, Callable[[date], Awaitable[Any]]], ...]:
+        return (
+            ("stats", self.aget_daily_stats),
+            ("sleep", self.aget_sleep_summary),
+            ("stress", self.aget_stress_summary),
+            ("body_battery", self.aget_body_battery_summary),
+            ("hrv", self.aget_hrv_summary),
+            ("intensity", self.aget_intensity_minutes_summary),
+            ("weight_entries", lambda target_date: self.aget_weight_range(target_date, target_date)),
+            ("activities", lambda target_date: self.aget_activities(target_date, target_date, None)),
+        )
+
+    def _fetch_activities_page(self, fetch: Callable[..., Any], page: int) -> Any:
+        return self._with_retries(fetch, page * ACTIVITIES_PAGE_SIZE, ACTIVITIES_PAGE_SIZE)
+
+    def _fetch_for_date(self, endpoint: str, target_date: date) -> dict[str, Any] | None:
+        fetch = self._endpoint(endpoint)
+        if fetch is None:
+            return None
+        return self._with_retries(fetch, target_date.isoformat())
+
+    def _endpoint(self, name: str) -> Callable[..., Any] | None:
+        self._client_or_raise()
+        return self._api[name]
+
+    def _extend_activities(self, data: list[dict[str, Any]], batch: Any, start: date) -> bool:
+        if not isinstance(batch, list) or not batch:
+            return False
+        data.extend(batch)
+        # A short page means Garmin has no older activities left.
+        if len(batch) < ACTIVITIES_PAGE_SIZE:
+            return False
+        oldest = self._oldest_activity_date(batch)
+        return not (oldest and oldest < start)
+
+    def _select_activities(
+        self, data: list[dict[str, Any]], start: date, end: date, activity_type: str | None
+    ) -> list[dict[str, Any]]:
+        wanted = activity_type.lower() if activity_type else None
+        selected: list[dict[str, Any]] = []
+        for activity in data:
+            activity_date = self._activity_date(activity)
+            if activity_date is None or activity_date > end:
+                continue
+            # Garmin lists activities newest-first, so nothing after this one can be in range.
+            if activity_date < start:
+                break
+            if wanted is None or self._activity_type(activity).lower() == wanted:
+                selected.append(activity)
+        return selected
+
+    async def arefresh_tokens(self) -> None:
+        async with self._refresh_lock:
+            await asyncio.to_thread(self._background_refresh)
+
+    def _background_refresh(self) -> None:
+        if not self._client or self._auth_status != "ok":
+            if self._email and self._password:
+                self._try_relogin_with_creds()
+            return
+        try:
+            self._with_retries(self._refresh_tokens)
+            self._auth_status = "ok"
+        except GarminAuthFailure as exc:
+            logger.exception(
+                "garmin_refresh_failed",
+                extra={
+                    "token_dir": self._token_dir,
+                    "has_email": bool(self._email),
+                    "error": str(exc),
+                },
+            )
+            self._auth_status = "error"
+            if self._email and self._password:
+                self._try_relogin_with_creds()
+        except Exception as exc:
+            # Transient failures keep the current tokens; the next cycle retries.
+            logger.exception(
+                "garmin_refresh_failed",
+                extra={
+                    "token_dir": self._token_dir,
+                    "has_email": bool(self._email),
+                    "error": str(exc),
+                },
+            )
+
     def _initialize_tokens(self) -> None:
         tokens = self._load_tokens()
         if tokens is not None:
             try:
-                self._with_retries(lambda: self._login_with_tokens(tokens.data))
-                self._with_retries(self._refresh_tokens)
+                self._with_retries(self._login_with_tokens, tokens.data)
+                if not self._tokens_fresh():
+                    self._with_retries(self._refresh_tokens)
+                elif self._legacy_token_file:
+                    self._persist_tokens_from_client()
                 self._auth_status = "ok"
                 return
             except (GarminAuthFailure, UpstreamTimeout) as exc:
@@ -202,13 +423,19 @@ class GarminClientWrapper:
             self._auth_status = "needs_login"
 
     def _load_tokens(self) -> _TokenBundle | None:
-        token_path = os.path.join(self._token_dir, TOKEN_FILE)
-        if not os.path.isfile(token_path):
+        bundle_path = os.path.join(self._token_dir, TOKEN_BUNDLE_FILE)
+        legacy_path = os.path.join(self._token_dir, TOKEN_FILE)
+        if os.path.isfile(bundle_path):
+            token_path, decode = bundle_path, _decode_token_bundle
+        elif os.path.isfile(legacy_path):
+            token_path, decode = legacy_path, jsonutil.loads
+            self._legacy_token_file = True
+        else:
             return None
         try:
-            with open(token_path, "r", encoding="utf-8") as handle:
-                data = json.load(handle)
-        except (OSError, json.JSONDecodeError) as exc:
+            with open(token_path, "rb") as handle:
+                data = decode(handle.read())
+        except (OSError, ValueError) as exc:
             logger.exception(
                 "garmin_tokens_load_failed",
                 extra={
@@ -227,9 +454,9 @@ class GarminClientWrapper:
         if not os.path.isfile(meta_path):
             return None
         try:
-            with open(meta_path, "r", encoding="utf-8") as handle:
-                payload = json.load(handle)
-        except (OSError, json.JSONDecodeError) as exc:
+            with open(meta_path, "rb") as handle:
+                payload = jsonutil.loads(handle.read())
+        except (OSError, jsonutil.JSONDecodeError) as exc:
             logger.exception(
                 "garmin_tokens_meta_load_failed",
                 extra={
@@ -252,34 +479,35 @@ class GarminClientWrapper:
             raise GarminAuthFailure("Missing Garmin credentials")
         if Garmin is None:
             raise RuntimeError("Garmin client library is unavailable")
-        self._client = Garmin(self._email, self._password)
-        self._client.login()
+        client = Garmin(self._email, self._password)
+        client.login()
+        # Only keep the client once login succeeded, so a failed attempt never looks authenticated.
+        self._client = client
         self.token_last_refresh = datetime.now(timezone.utc)
         self._persist_tokens_from_client()
 
     def _login_with_tokens(self, tokens: dict[str, Any]) -> None:
+        if not tokens:
+            self._login()
+            return
         if Garmin is None:
             raise RuntimeError("Garmin client library is unavailable")
         self._client = Garmin(self._email or "", self._password or "")
         garth = getattr(self._client, "garth", None)
-        restored = False
-        if garth is not None:
-            if hasattr(garth, "restore"):
-                garth.restore(tokens)
-                restored = True
-            elif hasattr(garth, "loads"):
-                garth.loads(json.dumps(tokens))
-                restored = True
-            elif hasattr(garth, "load") and isinstance(tokens, (str, bytes, os.PathLike)):
-                garth.load(tokens)
-                restored = True
-        if not restored:
+        method = _restore_method(type(garth)) if garth is not None else None
+        if method == "restore":
+            garth.restore(tokens)
+        elif method == "loads":
+            garth.loads(jsonutil.dumps(tokens).decode("utf-8"))
+        elif method == "load" and isinstance(tokens, (str, bytes, os.PathLike)):
+            garth.load(tokens)
+        else:
             self._login()
-            return
-        if garth is not None and hasattr(garth, "refresh"):
-            garth.refresh()
-        self.token_last_refresh = datetime.now(timezone.utc)
-        self._persist_tokens_from_client()
+
+    def _tokens_fresh(self) -> bool:
+        if self.token_last_refresh is None:
+            return False
+        return datetime.now(timezone.utc) - self.token_last_refresh < self._refresh_interval
 
     def _refresh_tokens(self) -> None:
         if not self._client:
@@ -292,12 +520,17 @@ class GarminClientWrapper:
 
     def _persist_tokens(self) -> None:
         self._ensure_token_dir()
-        token_path = os.path.join(self._token_dir, TOKEN_FILE)
+        token_path = os.path.join(self._token_dir, TOKEN_BUNDLE_FILE)
         payload = self._tokens.data if self._tokens else {}
         try:
-            self._atomic_write_json(token_path, payload)
+            self._atomic_write_bytes(token_path, _encode_token_bundle(payload))
             self._persist_meta()
+            if self._legacy_token_file:
+                with suppress(FileNotFoundError):
+                    os.remove(os.path.join(self._token_dir, TOKEN_FILE))
+                self._legacy_token_file = False
         except OSError as exc:
+            self._token_dir_ready = False
             logger.exception(
                 "garmin_tokens_write_failed",
                 extra={
@@ -318,8 +551,8 @@ class GarminClientWrapper:
                 dumped = garth.dumps()
                 if isinstance(dumped, str):
                     try:
-                        data = json.loads(dumped)
-                    except json.JSONDecodeError:
+                        data = jsonutil.loads(dumped)
+                    except jsonutil.JSONDecodeError:
                         data = {"raw": dumped}
                 elif isinstance(dumped, dict):
                     data = dumped
@@ -335,10 +568,9 @@ class GarminClientWrapper:
     def _persist_meta(self) -> None:
         self._ensure_token_dir()
         meta_path = os.path.join(self._token_dir, META_FILE)
-        last_refresh = self.token_last_refresh or datetime.now(timezone.utc)
-        payload = {"last_refresh": last_refresh.isoformat()}
+        last_refresh = (self.token_last_refresh or datetime.now(timezone.utc)).isoformat()
         try:
-            self._atomic_write_json(meta_path, payload)
+            self._atomic_write_bytes(meta_path, b'{"last_refresh":"' + last_refresh.encode() + b'"}')
         except OSError as exc:
             logger.exception(
                 "garmin_tokens_meta_write_failed",
@@ -351,58 +583,54 @@ class GarminClientWrapper:
             raise
 
     def _ensure_token_dir(self) -> None:
+        if self._token_dir_ready:
+            return
         os.makedirs(self._token_dir, mode=0o700, exist_ok=True)
         try:
             os.chmod(self._token_dir, 0o700)
         except OSError:
             pass
+        self._token_dir_ready = True
 
-    def _atomic_write_json(self, path: str, payload: dict[str, Any]) -> None:
+    def _atomic_write_bytes(self, path: str, data: bytes) -> None:
         directory = os.path.dirname(path)
         base = os.path.basename(path)
         temp_path = os.path.join(directory, f".{base}.tmp")
-        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC
+        # The temp file is only ever created here with 0o600 and os.replace keeps its mode,
+        # so the final file needs no separate chmod.
         fd = os.open(temp_path, flags, 0o600)
         try:
-            with os.fdopen(fd, "w", encoding="utf-8") as handle:
-                json.dump(payload, handle)
+            os.write(fd, data)
         finally:
-            try:
-                os.close(fd)
-            except OSError:
-                pass
+            os.close(fd)
         os.replace(temp_path, path)
-        try:
-            os.chmod(path, 0o600)
-        except OSError:
-            pass
 
-    def _with_retries(self, func: Callable[[], T]) -> T:
-        attempts = 3
-        base_delay = 0.5
-        for attempt in range(1, attempts + 1):
+    def _with_retries(self, func: Callable[..., T], *args: Any) -> T:
+        try:
+            return self._call_upstream(func, args)
+        except UpstreamTimeout as exc:
+            last_exc = exc
+        for attempt in range(1, RETRY_ATTEMPTS):
+            delay = RETRY_BASE_DELAY * (2 ** (attempt - 1))
+            delay += random.uniform(0, 0.2)
+            time.sleep(delay)
             try:
-                return func()
-            except GarminConnectAuthenticationError as exc:
-                raise GarminAuthFailure(str(exc)) from exc
-            except GarminConnectTimeoutError as exc:
-                last_exc: Exception = UpstreamTimeout(str(exc))
-            except GarminConnectConnectionError as exc:
-                last_exc = UpstreamTimeout(str(exc))
-            except GarminConnectTooManyRequestsError as exc:
-                last_exc = UpstreamTimeout(str(exc))
-            except GarminAuthFailure:
-                raise
-            except TimeoutError as exc:
-                last_exc: Exception = UpstreamTimeout(str(exc))
-            except Exception as exc:  # pragma: no cover - placeholder for upstream handling
+                return self._call_upstream(func, args)
+            except UpstreamTimeout as exc:
                 last_exc = exc
-            if attempt < attempts:
-                delay = base_delay * (2 ** (attempt - 1))
-                delay += random.uniform(0, 0.2)
-                time.sleep(delay)
-            else:
-                raise last_exc
+        raise last_exc
+
+    @staticmethod
+    def _call_upstream(func: Callable[..., T], args: tuple[Any, ...]) -> T:
+        try:
+            return func(*args)
+        except GarminConnectAuthenticationError as exc:
+            raise GarminAuthFailure(str(exc)) from exc
+        except GarminAuthFailure:
+            raise
+        except RETRYABLE_ERRORS as exc:
+            raise UpstreamTimeout(str(exc)) from exc
 
     def _client_or_raise(self) -> Garmin:
         if not self._client:
@@ -448,28 +676,14 @@ class GarminClientWrapper:
             return activity_type
         return activity.get("type") or ""
 
-    @classmethod
-    def _filter_activities_by_date(
-        cls, activities: list[dict[str, Any]], start: date, end: date
-    ) -> list[dict[str, Any]]:
-        filtered: list[dict[str, Any]] = []
-        for activity in activities:
-            activity_date = cls._activity_date(activity)
-            if not activity_date:
-                continue
-            if start <= activity_date <= end:
-                filtered.append(activity)
-        return filtered
-
     @staticmethod
     def _activity_date(activity: dict[str, Any]) -> date | None:
         for key in ("startTimeLocal", "startTimeGMT", "startTime", "startTimeUtc"):
             value = activity.get(key)
             if isinstance(value, str):
-                try:
-                    return date.fromisoformat(value.split(" ")[0])
-                except ValueError:
-                    continue
+                parsed = _parse_iso_date(value[:10])
+                if parsed is not None:
+                    return parsed
         timestamp = activity.get("beginTimestamp")
         if isinstance(timestamp, (int, float)):
             try:
@@ -480,11 +694,21 @@ class GarminClientWrapper:
 
     @classmethod
     def _oldest_activity_date(cls, activities: list[dict[str, Any]]) -> date | None:
-        dates = [cls._activity_date(activity) for activity in activities]
-        valid = [value for value in dates if value is not None]
-        return min(valid) if valid else None
+        # Pages are newest-first, so the last dated entry is the oldest one.
+        for activity in reversed(activities):
+            activity_date = cls._activity_date(activity)
+            if activity_date is not None:
+                return activity_date
+        return None
 
 
 @lru_cache(maxsize=1)
 def get_garmin_client() -> GarminClientWrapper:
     return GarminClientWrapper()
+
+
+async def token_refresh_loop(interval_seconds: int) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        client = await asyncio.to_thread(get_garmin_client)
+        await client.arefresh_tokens()
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both backends.
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(value: Any, sort_keys: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS if sort_keys else None)
+    return json.dumps(value, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,36 +1,76 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import os
+import re
 import time
 import uuid
+from contextlib import asynccontextmanager, suppress
 from datetime import date, timedelta
-from typing import Any
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Callable
 
-from fastapi import Depends, FastAPI, Path, Query, Request
-from fastapi.responses import Response
+from fastapi import FastAPI, Path, Query, Request, Security
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response, StreamingResponse
 
-from app.deps import api_key_guard
+from app.deps import api_key_header, api_key_middleware
 from app.errors import (
+    ERROR_RESPONSES,
     APIError,
     GarminAuthFailure,
     MissingGarminAuth,
     UpstreamTimeout,
     register_exception_handlers,
 )
-from app.garmin_client import get_garmin_client
+from app.garmin_client import get_garmin_client, token_refresh_loop
+from app.models import build_daily_links
 from app.cache import TTLCache, make_cache_key
-from app import normalize
+from app import jsonutil, normalize
+from app.responses import ORJSONResponse
 from app.settings import get_settings
 
 logger = logging.getLogger("garmin-service")
 cache = TTLCache()
 
-DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}$"
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII)
 MODE_PATTERN = r"^(normalized|raw)$"
 
-
+_ACTIVITY_TYPE_KEYS = ("typeKey", "type", "typeName", "typeId")
+_DURATION_KEYS = ("duration", "durationInSeconds", "durationSeconds")
+_DISTANCE_KEYS = ("distance", "distanceMeters", "distanceInMeters", "distanceMetersValue")
+_AVG_SPEED_KEYS = ("averageSpeed", "avgSpeed", "averageSpeedMps")
+_ELEVATION_GAIN_KEYS = (
+    "elevationGain",
+    "totalElevationGain",
+    "elevationGainInMeters",
+    "totalElevationGainMeters",
+)
+_ACTIVITY_CALORIES_KEYS = ("calories", "caloriesBurned", "totalCalories")
+_ACTIVITY_ID_KEYS = ("activityId", "activity_id")
+_AVG_HR_KEYS = ("averageHR", "avgHr", "avgHeartRate")
+_MAX_HR_KEYS = ("maxHR", "maxHeartRate")
+_SLEEP_SECONDS_KEYS = ("sleepTimeSeconds", "sleepTime", "sleepSeconds")
+_SLEEP_SCORE_KEYS = ("sleepScore", "overallSleepScore")
+_STRESS_AVG_KEYS = ("avgStressLevel", "avgStress", "averageStressLevel")
+_BODY_BATTERY_START_KEYS = ("bodyBatteryStart", "bodyBatteryBeginning")
+_BODY_BATTERY_END_KEYS = ("bodyBatteryEnd", "bodyBatteryEnding", "bodyBatteryValue")
+_HRV_STATUS_KEYS = ("status", "hrvStatus")
+_HRV_VALUE_KEYS = ("value", "hrvValue")
+_MODERATE_MINUTES_KEYS = ("moderateIntensityMinutes", "moderateMinutes")
+_VIGOROUS_MINUTES_KEYS = ("vigorousIntensityMinutes", "vigorousMinutes")
+_TOTAL_MINUTES_KEYS = ("totalIntensityMinutes", "totalMinutes")
+_STEPS_KEYS = ("totalSteps", "steps", "stepCount")
+_TOTAL_KCAL_KEYS = ("totalKilocalories", "totalCalories", "calories")
+_ACTIVE_KCAL_KEYS = ("activeKilocalories", "activeCalories")
+_RESTING_HR_KEYS = ("restingHeartRate", "restingHR")
+_WEIGHT_DATE_KEYS = ("date", "calendarDate", "measureDate", "dateTime", "samplePk")
+_WEIGHT_KG_KEYS = ("weight", "weightInKg", "weightInKilograms")
+_WEIGHT_GRAMS_KEYS = ("weightInGrams", "weightInGram")
+
+
+@lru_cache(maxsize=1)
 def _resolve_version() -> str:
     # 1) Preferred: semantic version injected at build/runtime (CI)
     v = os.getenv("VERSION")
@@ -79,17 +119,21 @@ def _not_implemented() -> None:
 
 
 def _parse_date(value: str, field: str) -> date:
-    try:
-        return date.fromisoformat(value)
-    except ValueError as exc:
-        raise APIError(400, "invalid_date", f"Invalid {field} date") from exc
+    # The shape check keeps out the compact and week forms date.fromisoformat also accepts.
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    raise APIError(400, "invalid_date", f"Invalid {field} date")
 
 
-def _validate_range(start: str, end: str) -> None:
+def _validate_range(start: str, end: str) -> tuple[date, date]:
     start_date = _parse_date(start, "start")
     end_date = _parse_date(end, "end")
     if start_date > end_date:
         raise APIError(400, "invalid_range", "Start date must be before end date")
+    return start_date, end_date
 
 
 def _error_code_from_exc(exc: Exception) -> str | None:
@@ -104,6 +148,18 @@ def _error_code_from_exc(exc: Exception) -> str | None:
     return None
 
 
+def _request_log_line(request: Request, request_id: str, latency_ms: int, error_code: str | None) -> str:
+    # Only the path and query params need JSON escaping; the other fields are known-safe primitives.
+    endpoint = jsonutil.dumps(request.url.path).decode("utf-8")
+    params = jsonutil.dumps(dict(request.query_params)).decode("utf-8")
+    cache_hit = "true" if getattr(request.state, "cache_hit", False) else "false"
+    error_json = "null" if error_code is None else jsonutil.dumps(error_code).decode("utf-8")
+    return (
+        f'{{"request_id":"{request_id}","endpoint":{endpoint},"params":{params},'
+        f'"latency_ms":{latency_ms},"cache_hit":{cache_hit},"error_code":{error_json}}}'
+    )
+
+
 def _get_first_value(payload: dict[str, Any], keys: tuple[str, ...]) -> Any:
     for key in keys:
         value = payload.get(key)
@@ -115,12 +171,11 @@ def _get_first_value(payload: dict[str, Any], keys: tuple[str, ...]) -> Any:
 def _activity_type(activity: dict[str, Any]) -> str | None:
     activity_type = activity.get("activityType") or {}
     if isinstance(activity_type, dict):
-        return (
-            activity_type.get("typeKey")
-            or activity_type.get("type")
-            or activity_type.get("typeName")
-            or activity_type.get("typeId")
-        )
+        for key in _ACTIVITY_TYPE_KEYS:
+            value = activity_type.get(key)
+            if value:
+                return value
+        return None
     if isinstance(activity_type, str):
         return activity_type
     return activity.get("type")
@@ -135,7 +190,7 @@ def _activity_start_time(activity: dict[str, Any]) -> str | None:
 
 
 def _activity_duration_s(activity: dict[str, Any]) -> int | None:
-    value = _get_first_value(activity, ("duration", "durationInSeconds", "durationSeconds"))
+    value = _get_first_value(activity, _DURATION_KEYS)
     if isinstance(value, (int, float)):
         if value > 10_000:
             return int(round(value / 1000))
@@ -144,43 +199,40 @@ def _activity_duration_s(activity: dict[str, Any]) -> int | None:
 
 
 def _activity_distance_meters(activity: dict[str, Any]) -> float | None:
-    value = _get_first_value(
-        activity, ("distance", "distanceMeters", "distanceInMeters", "distanceMetersValue")
-    )
+    value = _get_first_value(activity, _DISTANCE_KEYS)
     if isinstance(value, (int, float)):
         return float(value)
     return None
 
 
 def _activity_avg_speed_mps(activity: dict[str, Any]) -> float | None:
-    value = _get_first_value(activity, ("averageSpeed", "avgSpeed", "averageSpeedMps"))
+    value = _get_first_value(activity, _AVG_SPEED_KEYS)
     if isinstance(value, (int, float)):
         return float(value)
     return None
 
 
 def _activity_elevation_gain_m(activity: dict[str, Any]) -> float | None:
-    value = _get_first_value(
-        activity,
-        ("elevationGain", "totalElevationGain", "elevationGainInMeters", "totalElevationGainMeters"),
-    )
+    value = _get_first_value(activity, _ELEVATION_GAIN_KEYS)
     if isinstance(value, (int, float)):
         return float(value)
     return None
 
 
 def _activity_calories(activity: dict[str, Any]) -> int | None:
-    value = _get_first_value(activity, ("calories", "caloriesBurned", "totalCalories"))
+    value = _get_first_value(activity, _ACTIVITY_CALORIES_KEYS)
     if isinstance(value, (int, float)):
         return int(round(value))
     return None
 
 
-def _normalize_activity_stub(activity: dict[str, Any]) -> dict[str, Any]:
-    distance_meters = _activity_distance_meters(activity)
-    avg_speed_mps = _activity_avg_speed_mps(activity)
-    elevation_m = _activity_elevation_gain_m(activity)
-    activity_id = _get_first_value(activity, ("activityId", "activity_id"))
+def _activity_row(
+    activity: dict[str, Any],
+    distance_mi: float | None,
+    avg_speed_mph: float | None,
+    elevation_gain_ft: int | None,
+) -> dict[str, Any]:
+    activity_id = _get_first_value(activity, _ACTIVITY_ID_KEYS)
     activity_id_value = int(activity_id) if isinstance(activity_id, (int, float, str)) else None
     return {
         "activityId": activity_id_value,
@@ -188,143 +240,158 @@ def _normalize_activity_stub(activity: dict[str, Any]) -> dict[str, Any]:
         "name": _activity_name(activity),
         "startTimeLocal": _activity_start_time(activity),
         "duration_s": _activity_duration_s(activity),
-        "distance_mi": normalize.distance_mi_always(distance_meters) if distance_meters is not None else None,
-        "avg_speed_mph": (
-            normalize.round_speed_mph(normalize.mps_to_mph(avg_speed_mps))
-            if avg_speed_mps is not None
-            else None
-        ),
-        "elevation_gain_ft": (
-            normalize.round_elevation_ft(normalize.m_to_ft(elevation_m)) if elevation_m is not None else None
-        ),
+        "distance_mi": distance_mi,
+        "avg_speed_mph": avg_speed_mph,
+        "elevation_gain_ft": elevation_gain_ft,
     }
 
 
+def _normalize_activity_stub(activity: dict[str, Any]) -> dict[str, Any]:
+    distance_meters = _activity_distance_meters(activity)
+    avg_speed_mps = _activity_avg_speed_mps(activity)
+    elevation_m = _activity_elevation_gain_m(activity)
+    return _activity_row(
+        activity,
+        normalize.distance_mi_always(distance_meters) if distance_meters is not None else None,
+        normalize.round_speed_mph(normalize.mps_to_mph(avg_speed_mps)) if avg_speed_mps is not None else None,
+        normalize.round_elevation_ft(normalize.m_to_ft(elevation_m)) if elevation_m is not None else None,
+    )
+
+
 def _normalize_activity_list_item(activity: dict[str, Any]) -> dict[str, Any]:
     payload = _normalize_activity_stub(activity)
     payload["calories_kcal"] = _activity_calories(activity)
     return payload
 
 
+def _normalize_activity_list(activities: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    # Columnar: extract each metric as one list, convert whole columns, then zip rows back together.
+    columns = normalize.normalize_activities_batch(
+        [_activity_distance_meters(activity) for activity in activities],
+        [_activity_avg_speed_mps(activity) for activity in activities],
+        [_activity_elevation_gain_m(activity) for activity in activities],
+    )
+    rows = []
+    for activity, distance_mi, avg_speed_mph, elevation_gain_ft in zip(
+        activities, columns["distance_mi"], columns["avg_speed_mph"], columns["elevation_gain_ft"]
+    ):
+        row = _activity_row(activity, distance_mi, avg_speed_mph, elevation_gain_ft)
+        row["calories_kcal"] = _activity_calories(activity)
+        rows.append(row)
+    return rows
+
+
 def _normalize_activity_detail(activity: dict[str, Any]) -> dict[str, Any]:
     payload = _normalize_activity_list_item(activity)
-    payload["avg_hr_bpm"] = _get_first_value(activity, ("averageHR", "avgHr", "avgHeartRate"))
-    payload["max_hr_bpm"] = _get_first_value(activity, ("maxHR", "maxHeartRate"))
+    payload["avg_hr_bpm"] = _get_first_value(activity, _AVG_HR_KEYS)
+    payload["max_hr_bpm"] = _get_first_value(activity, _MAX_HR_KEYS)
     return payload
 
 
-def _extract_sleep_fields(payload: dict[str, Any] | None) -> dict[str, Any]:
-    if not payload or not isinstance(payload, dict):
-        return {}
-    daily = payload.get("dailySleepDTO") or payload
-    if not isinstance(daily, dict):
-        return {}
-    sleep_seconds = _get_first_value(daily, ("sleepTimeSeconds", "sleepTime", "sleepSeconds"))
-    score = _get_first_value(daily, ("sleepScore", "overallSleepScore"))
-    return {
-        "sleep_seconds": int(sleep_seconds) if isinstance(sleep_seconds, (int, float)) else None,
-        "sleep_score": int(score) if isinstance(score, (int, float)) else None,
-    }
+def _int_or_none(value: Any) -> int | None:
+    return int(value) if isinstance(value, (int, float)) else None
 
 
-def _extract_stress_fields(payload: dict[str, Any] | None) -> dict[str, Any]:
-    if not payload or not isinstance(payload, dict):
-        return {}
-    avg = _get_first_value(payload, ("avgStressLevel", "avgStress", "averageStressLevel"))
-    return {"stress_avg": int(avg) if isinstance(avg, (int, float)) else None}
+def _float_or_none(value: Any) -> float | None:
+    return float(value) if isinstance(value, (int, float)) else None
 
 
-def _extract_body_battery_fields(payload: dict[str, Any] | None) -> dict[str, Any]:
-    if not payload or not isinstance(payload, dict):
-        return {}
-    start = _get_first_value(payload, ("bodyBatteryStart", "bodyBatteryBeginning"))
-    end = _get_first_value(payload, ("bodyBatteryEnd", "bodyBatteryEnding", "bodyBatteryValue"))
-    return {
-        "body_battery_start": int(start) if isinstance(start, (int, float)) else None,
-        "body_battery_end": int(end) if isinstance(end, (int, float)) else None,
-    }
+def _as_is(value: Any) -> Any:
+    return value
 
 
-def _extract_hrv_fields(payload: dict[str, Any] | None) -> dict[str, Any]:
-    if not payload or not isinstance(payload, dict):
-        return {}
-    status = _get_first_value(payload, ("status", "hrvStatus"))
-    value = _get_first_value(payload, ("value", "hrvValue"))
-    return {"hrv_status": status, "hrv_value": float(value) if isinstance(value, (int, float)) else None}
+_SummaryField = tuple[str, tuple[str, ...], Callable[[Any], Any]]
 
+# Grouped by source so each Garmin payload is type-checked once and its fields read in one pass.
+_SUMMARY_SCHEMA: tuple[tuple[str, tuple[_SummaryField, ...]], ...] = (
+    (
+        "stats",
+        (
+            ("steps", _STEPS_KEYS, _int_or_none),
+            ("calories_total_kcal", _TOTAL_KCAL_KEYS, _int_or_none),
+            ("calories_active_kcal", _ACTIVE_KCAL_KEYS, _int_or_none),
+            ("resting_hr_bpm", _RESTING_HR_KEYS, _int_or_none),
+        ),
+    ),
+    (
+        "sleep",
+        (
+            ("sleep_seconds", _SLEEP_SECONDS_KEYS, _int_or_none),
+            ("sleep_score", _SLEEP_SCORE_KEYS, _int_or_none),
+        ),
+    ),
+    ("stress", (("stress_avg", _STRESS_AVG_KEYS, _int_or_none),)),
+    (
+        "body_battery",
+        (
+            ("body_battery_start", _BODY_BATTERY_START_KEYS, _int_or_none),
+            ("body_battery_end", _BODY_BATTERY_END_KEYS, _int_or_none),
+        ),
+    ),
+    (
+        "hrv",
+        (
+            ("hrv_status", _HRV_STATUS_KEYS, _as_is),
+            ("hrv_value", _HRV_VALUE_KEYS, _float_or_none),
+        ),
+    ),
+    (
+        "intensity",
+        (
+            ("intensity_minutes_moderate", _MODERATE_MINUTES_KEYS, _int_or_none),
+            ("intensity_minutes_vigorous", _VIGOROUS_MINUTES_KEYS, _int_or_none),
+            ("intensity_minutes_total", _TOTAL_MINUTES_KEYS, _int_or_none),
+        ),
+    ),
+)
 
-def _extract_intensity_fields(payload: dict[str, Any] | None) -> dict[str, Any]:
-    if not payload or not isinstance(payload, dict):
-        return {}
-    moderate = _get_first_value(payload, ("moderateIntensityMinutes", "moderateMinutes"))
-    vigorous = _get_first_value(payload, ("vigorousIntensityMinutes", "vigorousMinutes"))
-    total = _get_first_value(payload, ("totalIntensityMinutes", "totalMinutes"))
-    return {
-        "intensity_minutes_moderate": int(moderate) if isinstance(moderate, (int, float)) else None,
-        "intensity_minutes_vigorous": int(vigorous) if isinstance(vigorous, (int, float)) else None,
-        "intensity_minutes_total": int(total) if isinstance(total, (int, float)) else None,
-    }
+# Copying a presized prototype fixes the key order and skips rebuilding the table per day.
+_SUMMARY_TEMPLATE: dict[str, Any] = dict.fromkeys(
+    [*(field for _, fields in _SUMMARY_SCHEMA for field, _, _ in fields), "weight_lb"]
+)
 
 
-def _extract_daily_stats_fields(payload: dict[str, Any] | None) -> dict[str, Any]:
+def _daily_sleep(payload: Any) -> Any:
     if not payload or not isinstance(payload, dict):
-        return {}
-    steps = _get_first_value(payload, ("totalSteps", "steps", "stepCount"))
-    total_kcal = _get_first_value(payload, ("totalKilocalories", "totalCalories", "calories"))
-    active_kcal = _get_first_value(payload, ("activeKilocalories", "activeCalories"))
-    resting_hr = _get_first_value(payload, ("restingHeartRate", "restingHR"))
-    return {
-        "steps": int(steps) if isinstance(steps, (int, float)) else None,
-        "calories_total_kcal": int(total_kcal) if isinstance(total_kcal, (int, float)) else None,
-        "calories_active_kcal": int(active_kcal) if isinstance(active_kcal, (int, float)) else None,
-        "resting_hr_bpm": int(resting_hr) if isinstance(resting_hr, (int, float)) else None,
-    }
+        return None
+    return payload.get("dailySleepDTO") or payload
 
 
-def _weight_entry_date(entry: dict[str, Any]) -> date | None:
-    for key in ("date", "calendarDate", "measureDate", "dateTime", "samplePk"):
+def _weight_entry_on(entry: dict[str, Any], target_iso: str) -> bool:
+    # The first key holding a date-shaped string decides the entry's day; comparing the
+    # ten-character prefix avoids splitting and parsing every entry.
+    for key in _WEIGHT_DATE_KEYS:
         value = entry.get(key)
-        if isinstance(value, str):
-            try:
-                return date.fromisoformat(value.split("T")[0])
-            except ValueError:
-                continue
-    return None
+        if isinstance(value, str) and _DATE_RE.match(value):
+            return value[:10] == target_iso
+    return False
 
 
 def _weight_entry_kg(entry: dict[str, Any]) -> float | None:
-    value = _get_first_value(entry, ("weight", "weightInKg", "weightInKilograms"))
+    value = _get_first_value(entry, _WEIGHT_KG_KEYS)
     if isinstance(value, (int, float)):
         return float(value)
-    value = _get_first_value(entry, ("weightInGrams", "weightInGram"))
+    value = _get_first_value(entry, _WEIGHT_GRAMS_KEYS)
     if isinstance(value, (int, float)):
         return float(value) / 1000
     return None
 
 
 def _latest_weight_for_date(entries: list[dict[str, Any]], target: date) -> float | None:
-    latest_weight: float | None = None
-    for entry in entries:
-        entry_date = _weight_entry_date(entry)
-        if entry_date != target:
-            continue
-        weight_kg = _weight_entry_kg(entry)
-        if weight_kg is not None:
-            latest_weight = weight_kg
-    return latest_weight
+    target_iso = target.isoformat()
+    # The last matching entry wins, so scanning from the end can stop at the first hit.
+    for entry in reversed(entries):
+        if _weight_entry_on(entry, target_iso):
+            weight_kg = _weight_entry_kg(entry)
+            if weight_kg is not None:
+                return weight_kg
+    return None
 
 
+@lru_cache(maxsize=4096)
 def _daily_links(date_str: str) -> dict[str, str]:
-    return {
-        "daily": f"/daily?date={date_str}&mode=normalized",
-        "sleep": f"/sleep?date={date_str}&mode=normalized",
-        "activities": f"/activities?start={date_str}&end={date_str}&mode=normalized",
-        "activity_detail_template": "/activities/{activityId}?mode=normalized",
-        "stress": f"/stress?date={date_str}&mode=normalized",
-        "body_battery": f"/body-battery?date={date_str}&mode=normalized",
-        "hrv": f"/hrv?date={date_str}&mode=normalized",
-        "intensity_minutes": f"/intensity-minutes?date={date_str}&mode=normalized",
-    }
+    # Shared by every payload for the date; payloads are only ever encoded, never mutated.
+    return build_daily_links(date_str)
 
 
 def _normalize_daily(
@@ -338,29 +405,21 @@ def _normalize_daily(
     weight_entries: list[dict[str, Any]],
     activities: list[dict[str, Any]],
 ) -> dict[str, Any]:
-    summary: dict[str, Any] = {
-        "steps": None,
-        "calories_total_kcal": None,
-        "calories_active_kcal": None,
-        "resting_hr_bpm": None,
-        "sleep_seconds": None,
-        "sleep_score": None,
-        "stress_avg": None,
-        "body_battery_start": None,
-        "body_battery_end": None,
-        "hrv_status": None,
-        "hrv_value": None,
-        "intensity_minutes_moderate": None,
-        "intensity_minutes_vigorous": None,
-        "intensity_minutes_total": None,
-        "weight_lb": None,
+    sources = {
+        "stats": stats,
+        "sleep": _daily_sleep(sleep),
+        "stress": stress,
+        "body_battery": body_battery,
+        "hrv": hrv,
+        "intensity": intensity,
     }
-    summary.update(_extract_daily_stats_fields(stats))
-    summary.update(_extract_sleep_fields(sleep))
-    summary.update(_extract_stress_fields(stress))
-    summary.update(_extract_body_battery_fields(body_battery))
-    summary.update(_extract_hrv_fields(hrv))
-    summary.update(_extract_intensity_fields(intensity))
+    summary = _SUMMARY_TEMPLATE.copy()
+    for source_name, fields in _SUMMARY_SCHEMA:
+        source = sources[source_name]
+        if not isinstance(source, dict):
+            continue
+        for field, keys, cast in fields:
+            summary[field] = cast(_get_first_value(source, keys))
 
     weight_kg = _latest_weight_for_date(weight_entries, target_date)
     summary["weight_lb"] = (
@@ -398,12 +457,74 @@ def _daily_raw_payload(
     }
 
 
+@asynccontextmanager
+async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Build the client (token load and login) before serving so no request pays for it.
+    await asyncio.to_thread(get_garmin_client)
+    interval = get_settings().token_refresh_interval_seconds
+    refresher = asyncio.create_task(token_refresh_loop(interval)) if interval > 0 else None
+    try:
+        yield
+    finally:
+        if refresher is not None:
+            refresher.cancel()
+            with suppress(asyncio.CancelledError):
+                await refresher
+
+
 def create_app() -> FastAPI:
     settings = get_settings()
     logging.basicConfig(level=settings.log_level, format="%(message)s")
 
-    app = FastAPI(dependencies=[Depends(api_key_guard)])
+    app = FastAPI(
+        default_response_class=ORJSONResponse,
+        lifespan=_lifespan,
+        responses=ERROR_RESPONSES,
+        dependencies=[Security(api_key_header)],
+    )
     register_exception_handlers(app)
+    ttl_seconds = settings.cache_ttl_seconds
+    stale_seconds = settings.cache_stale_seconds
+    # Resolved once at startup: the build version cannot change under a running process.
+    _resolve_version()
+    refresh_tasks: dict[str, asyncio.Task[None]] = {}
+    miss_locks: dict[str, asyncio.Lock] = {}
+
+    async def refresh_cached(cache_key: str, compute: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            cache.set(cache_key, await compute(), ttl_seconds, stale_seconds)
+        except Exception as exc:
+            logger.exception("cache_refresh_failed", extra={"cache_key": cache_key, "error": str(exc)})
+
+    async def cached_or_compute(
+        request: Request, cache_key: str, compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        entry = cache.get_with_meta(cache_key)
+        if entry is None:
+            lock = miss_locks.setdefault(cache_key, asyncio.Lock())
+            try:
+                async with lock:
+                    # Another request may have filled the entry while this one waited.
+                    entry = cache.get_with_meta(cache_key)
+                    if entry is None:
+                        value = await compute()
+                        cache.set(cache_key, value, ttl_seconds, stale_seconds)
+                        return value
+            finally:
+                if miss_locks.get(cache_key) is lock:
+                    del miss_locks[cache_key]
+        value, fresh_until = entry
+        request.state.cache_hit = True
+        # Serve stale entries immediately and refresh them once in the background.
+        if fresh_until < time.monotonic() and cache_key not in refresh_tasks:
+            task = asyncio.create_task(refresh_cached(cache_key, compute))
+            refresh_tasks[cache_key] = task
+            task.add_done_callback(lambda _: refresh_tasks.pop(cache_key, None))
+        return value
+
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+    # Registered before request_logger so the logger wraps it and still records rejected requests.
+    app.middleware("http")(api_key_middleware)
 
     @app.middleware("http")
     async def request_logger(request: Request, call_next) -> Response:
@@ -415,147 +536,114 @@ def create_app() -> FastAPI:
             response = await call_next(request)
         except Exception as exc:
             latency_ms = int((time.perf_counter() - start) * 1000)
-            payload = {
-                "request_id": request_id,
-                "endpoint": request.url.path,
-                "params": dict(request.query_params),
-                "latency_ms": latency_ms,
-                "cache_hit": getattr(request.state, "cache_hit", False),
-                "error_code": _error_code_from_exc(exc),
-            }
-            logger.error(json.dumps(payload, separators=(",", ":")))
+            logger.error(_request_log_line(request, request_id, latency_ms, _error_code_from_exc(exc)))
             raise
         latency_ms = int((time.perf_counter() - start) * 1000)
-        payload = {
-            "request_id": request_id,
-            "endpoint": request.url.path,
-            "params": dict(request.query_params),
-            "latency_ms": latency_ms,
-            "cache_hit": getattr(request.state, "cache_hit", False),
-            "error_code": None,
-        }
-        logger.info(json.dumps(payload, separators=(",", ":")))
+        logger.info(_request_log_line(request, request_id, latency_ms, None))
         return response
 
     @app.get("/health")
-    def health() -> dict[str, object]:
+    def health() -> ORJSONResponse:
         settings = get_settings()
         client = get_garmin_client()
         token_last_refresh = client.token_last_refresh.isoformat() if client.token_last_refresh else None
-        return {
-            "status": "ok",
-            "version": _resolve_version(),
-            "auth": client.auth_status(),
-            "token_dir": settings.token_dir,
-            "token_last_refresh": token_last_refresh,
-        }
+        return ORJSONResponse(
+            {
+                "status": "ok",
+                "version": _resolve_version(),
+                "auth": client.auth_status(),
+                "token_dir": settings.token_dir,
+                "token_last_refresh": token_last_refresh,
+            }
+        )
+
+    @app.post("/admin/bump-cache")
+    def bump_cache() -> ORJSONResponse:
+        return ORJSONResponse({"cache_version": cache.bump_version()})
 
     @app.get("/daily")
-    def daily(
+    async def daily(
         request: Request,
-        date: str = Query(..., pattern=DATE_PATTERN),
+        date: str = Query(...),
         mode: str = Query("normalized", pattern=MODE_PATTERN),
-    ) -> dict[str, Any]:
+    ) -> ORJSONResponse:
         target_date = _parse_date(date, "date")
         params = {"date": date}
-        cache_key = make_cache_key("daily", params, mode)
-        cached = cache.get(cache_key)
-        if cached is not None:
-            request.state.cache_hit = True
-            return cached
+        cache_key = make_cache_key("daily", params, mode, cache.version)
 
-        client = get_garmin_client()
-        client.ensure_auth_or_503()
-
-        stats = client.get_daily_stats(target_date)
-        sleep = client.get_sleep_summary(target_date)
-        stress = client.get_stress_summary(target_date)
-        body_battery = client.get_body_battery_summary(target_date)
-        hrv = client.get_hrv_summary(target_date)
-        intensity = client.get_intensity_minutes_summary(target_date)
-        weight_entries = client.get_weight_range(target_date, target_date)
-        activities = client.get_activities(target_date, target_date, None)
-
-        if mode == "raw":
-            payload = _daily_raw_payload(
-                stats, sleep, stress, body_battery, hrv, intensity, weight_entries, activities
-            )
-        else:
-            payload = _normalize_daily(
-                target_date,
-                stats,
-                sleep,
-                stress,
-                body_battery,
-                hrv,
-                intensity,
-                weight_entries,
-                activities,
-            )
-        cache.set(cache_key, payload, settings.cache_ttl_seconds)
-        return payload
+        async def compute() -> dict[str, Any]:
+            client = get_garmin_client()
+            client.ensure_auth_or_503()
+            (day,) = await client.aget_daily_bundle([target_date])
+            if mode == "raw":
+                return _daily_raw_payload(**day)
+            return _normalize_daily(target_date, **day)
+
+        return ORJSONResponse(await cached_or_compute(request, cache_key, compute))
 
     @app.get("/daily/range")
-    def daily_range(
+    async def daily_range(
         request: Request,
-        start: str = Query(..., pattern=DATE_PATTERN),
-        end: str = Query(..., pattern=DATE_PATTERN),
+        start: str = Query(...),
+        end: str = Query(...),
         mode: str = Query("normalized", pattern=MODE_PATTERN),
-    ) -> dict[str, Any]:
-        _validate_range(start, end)
-        start_date = _parse_date(start, "start")
-        end_date = _parse_date(end, "end")
-        params = {"start": start, "end": end}
-        cache_key = make_cache_key("daily_range", params, mode)
-        cached = cache.get(cache_key)
-        if cached is not None:
-            request.state.cache_hit = True
-            return cached
-
-        client = get_garmin_client()
-        client.ensure_auth_or_503()
-
-        days: list[dict[str, Any]] = []
-        current = start_date
-        while current <= end_date:
-            stats = client.get_daily_stats(current)
-            sleep = client.get_sleep_summary(current)
-            stress = client.get_stress_summary(current)
-            body_battery = client.get_body_battery_summary(current)
-            hrv = client.get_hrv_summary(current)
-            intensity = client.get_intensity_minutes_summary(current)
-            weight_entries = client.get_weight_range(current, current)
-            activities = client.get_activities(current, current, None)
+        stream: bool = Query(False),
+    ) -> Response:
+        start_date, end_date = _validate_range(start, end)
+        span = (end_date - start_date).days + 1
+        dates = [start_date + timedelta(days=offset) for offset in range(span)]
+        # Reuse /daily cache entries so overlapping single-day and range requests share upstream work.
+        version = cache.version
+        day_keys = {
+            current: make_cache_key("daily", {"date": current.isoformat()}, mode, version)
+            for current in dates
+        }
 
-            if mode == "raw":
-                payload = _daily_raw_payload(
-                    stats, sleep, stress, body_battery, hrv, intensity, weight_entries, activities
-                )
-                payload["date"] = current.isoformat()
-                days.append(payload)
-            else:
-                days.append(
-                    _normalize_daily(
-                        current,
-                        stats,
-                        sleep,
-                        stress,
-                        body_battery,
-                        hrv,
-                        intensity,
-                        weight_entries,
-                        activities,
-                    )
-                )
-            current += timedelta(days=1)
-
-        response = {"start": start, "end": end, "days": days}
-        cache.set(cache_key, response, settings.cache_ttl_seconds)
-        return response
+        def store_day(current: date, day: dict[str, Any]) -> dict[str, Any]:
+            payload = _daily_raw_payload(**day) if mode == "raw" else _normalize_daily(current, **day)
+            cache.set(day_keys[current], payload, ttl_seconds, stale_seconds)
+            return payload
+
+        def range_item(current: date, payload: dict[str, Any]) -> dict[str, Any]:
+            return dict(payload, date=current.isoformat()) if mode == "raw" else payload
+
+        if stream:
+            cached_days = [(current, cache.get(day_keys[current])) for current in dates]
+            missing = [current for current, payload in cached_days if payload is None]
+            client = get_garmin_client()
+            if missing:
+                client.ensure_auth_or_503()
+
+            async def lines() -> AsyncIterator[bytes]:
+                for current, payload in cached_days:
+                    if payload is not None:
+                        yield jsonutil.dumps(range_item(current, payload)) + b"\n"
+                # Remaining days are emitted as they complete, not in date order.
+                async for current, day in client.aiter_daily_bundles(missing):
+                    yield jsonutil.dumps(range_item(current, store_day(current, day))) + b"\n"
+
+            return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+        async def compute() -> bytes:
+            day_payloads = {current: cache.get(day_keys[current]) for current in dates}
+            missing = [current for current, payload in day_payloads.items() if payload is None]
+            if missing:
+                client = get_garmin_client()
+                client.ensure_auth_or_503()
+                bundles = await client.aget_daily_bundle(missing)
+                for current, day in zip(missing, bundles):
+                    day_payloads[current] = store_day(current, day)
+            days = [range_item(current, payload) for current, payload in day_payloads.items()]
+            # Rendered once and cached as bytes so hits skip jsonable_encoder and re-serialization.
+            return jsonutil.dumps({"start": start, "end": end, "days": days})
+
+        cache_key = make_cache_key("daily_range", {"start": start, "end": end}, mode, version)
+        body = await cached_or_compute(request, cache_key, compute)
+        return Response(content=body, media_type="application/json")
 
     @app.get("/sleep")
     def sleep(
-        date: str = Query(..., pattern=DATE_PATTERN),
+        date: str = Query(...),
         mode: str = Query("normalized", pattern=MODE_PATTERN),
     ) -> None:
         _parse_date(date, "date")
@@ -564,8 +652,8 @@ def create_app() -> FastAPI:
 
     @app.get("/body")
     def body(
-        start: str = Query(..., pattern=DATE_PATTERN),
-        end: str = Query(..., pattern=DATE_PATTERN),
+        start: str = Query(...),
+        end: str = Query(...),
         mode: str = Query("normalized", pattern=MODE_PATTERN),
     ) -> None:
         _validate_range(start, end)
@@ -573,64 +661,55 @@ def create_app() -> FastAPI:
         _not_implemented()
 
     @app.get("/activities")
-    def activities(
+    async def activities(
         request: Request,
-        start: str = Query(..., pattern=DATE_PATTERN),
-        end: str = Query(..., pattern=DATE_PATTERN),
+        start: str = Query(...),
+        end: str = Query(...),
         type: str | None = Query(None),
         mode: str = Query("normalized", pattern=MODE_PATTERN),
-    ) -> Any:
-        _validate_range(start, end)
-        start_date = _parse_date(start, "start")
-        end_date = _parse_date(end, "end")
+    ) -> Response:
+        start_date, end_date = _validate_range(start, end)
         params = {"start": start, "end": end, "type": type}
-        cache_key = make_cache_key("activities", params, mode)
-        cached = cache.get(cache_key)
-        if cached is not None:
-            request.state.cache_hit = True
-            return cached
+        cache_key = make_cache_key("activities", params, mode, cache.version)
 
-        client = get_garmin_client()
-        client.ensure_auth_or_503()
-        raw = client.get_activities(start_date, end_date, type)
-
-        if mode == "raw":
-            payload = raw
-        else:
-            payload = {
-                "start": start,
-                "end": end,
-                "activities": [_normalize_activity_list_item(activity) for activity in raw],
-            }
-        cache.set(cache_key, payload, settings.cache_ttl_seconds)
-        return payload
+        async def compute() -> bytes:
+            client = get_garmin_client()
+            client.ensure_auth_or_503()
+            raw = await client.aget_activities(start_date, end_date, type)
+            if mode == "raw":
+                return jsonutil.dumps(raw)
+            return jsonutil.dumps(
+                {
+                    "start": start,
+                    "end": end,
+                    "activities": _normalize_activity_list(raw),
+                }
+            )
+
+        body = await cached_or_compute(request, cache_key, compute)
+        return Response(content=body, media_type="application/json")
 
     @app.get("/activities/{activityId}")
-    def activity_detail(
+    async def activity_detail(
         request: Request,
         activityId: str = Path(...),
         mode: str = Query("normalized", pattern=MODE_PATTERN),
-    ) -> Any:
+    ) -> Response:
         params = {"activityId": activityId}
-        cache_key = make_cache_key("activity_detail", params, mode)
-        cached = cache.get(cache_key)
-        if cached is not None:
-            request.state.cache_hit = True
-            return cached
+        cache_key = make_cache_key("activity_detail", params, mode, cache.version)
 
-        client = get_garmin_client()
-        client.ensure_auth_or_503()
-        raw = client.get_activity_detail(activityId)
-        if mode == "raw":
-            payload = raw
-        else:
-            payload = _normalize_activity_detail(raw)
-        cache.set(cache_key, payload, settings.cache_ttl_seconds)
-        return payload
+        async def compute() -> bytes:
+            client = get_garmin_client()
+            client.ensure_auth_or_503()
+            raw = await asyncio.to_thread(client.get_activity_detail, activityId)
+            return jsonutil.dumps(raw if mode == "raw" else _normalize_activity_detail(raw))
+
+        body = await cached_or_compute(request, cache_key, compute)
+        return Response(content=body, media_type="application/json")
 
     @app.get("/stress")
     def stress(
-        date: str = Query(..., pattern=DATE_PATTERN),
+        date: str = Query(...),
         mode: str = Query("normalized", pattern=MODE_PATTERN),
     ) -> None:
         _parse_date(date, "date")
@@ -639,7 +718,7 @@ def create_app() -> FastAPI:
 
     @app.get("/body-battery")
     def body_battery(
-        date: str = Query(..., pattern=DATE_PATTERN),
+        date: str = Query(...),
         mode: str = Query("normalized", pattern=MODE_PATTERN),
     ) -> None:
         _parse_date(date, "date")
@@ -648,7 +727,7 @@ def create_app() -> FastAPI:
 
     @app.get("/hrv")
     def hrv(
-        date: str = Query(..., pattern=DATE_PATTERN),
+        date: str = Query(...),
         mode: str = Query("normalized", pattern=MODE_PATTERN),
     ) -> None:
         _parse_date(date, "date")
@@ -657,7 +736,7 @@ def create_app() -> FastAPI:
 
     @app.get("/intensity-minutes")
     def intensity_minutes(
-        date: str = Query(..., pattern=DATE_PATTERN),
+        date: str = Query(...),
         mode: str = Query("normalized", pattern=MODE_PATTERN),
     ) -> None:
         _parse_date(date, "date")
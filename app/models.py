@@ -1,44 +1,48 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, StringConstraints
 
+DateStr = Annotated[str, StringConstraints(pattern=r"^\d{4}-\d{2}-\d{2}$")]
 
-class ErrorDetail(BaseModel):
+
+class ResponseModel(BaseModel):
+    # Subclasses' own model_config dicts are merged on top of this one.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class ErrorDetail(ResponseModel):
     code: str
     message: str
     detail: str | None = None
 
 
-class ErrorEnvelope(BaseModel):
+class ErrorEnvelope(ResponseModel):
     error: ErrorDetail
 
 
-class HealthResponse(BaseModel):
+_HEALTH_EXAMPLE = {
+    "status": "ok",
+    "version": "dev",
+    "auth": "ok",
+    "token_dir": "/data/tokens",
+    "token_last_refresh": "2024-01-01T12:00:00+00:00",
+}
+
+
+class HealthResponse(ResponseModel):
     status: Literal["ok"]
     version: str
     auth: Literal["ok", "needs_login", "error"]
     token_dir: str
     token_last_refresh: datetime | None = None
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "status": "ok",
-                    "version": "dev",
-                    "auth": "ok",
-                    "token_dir": "/data/tokens",
-                    "token_last_refresh": "2024-01-01T12:00:00+00:00",
-                }
-            ]
-        }
-    }
+    model_config = {"json_schema_extra": {"examples": [_HEALTH_EXAMPLE]}}
 
 
-class DailyActivityStub(BaseModel):
+class DailyActivityStub(ResponseModel):
     activityId: int
     type: str | None = None
     name: str | None = None
@@ -49,7 +53,7 @@ class DailyActivityStub(BaseModel):
     elevation_gain_ft: int | None = None
 
 
-class DailyLinks(BaseModel):
+class DailyLinks(ResponseModel):
     daily: str
     sleep: str
     activities: str
@@ -60,7 +64,24 @@ class DailyLinks(BaseModel):
     intensity_minutes: str
 
 
-class DailySummary(BaseModel):
+# Formatted with str.format, so the detail link's own placeholder is escaped.
+_LINK_TEMPLATES = {
+    "daily": "/daily?date={d}&mode=normalized",
+    "sleep": "/sleep?date={d}&mode=normalized",
+    "activities": "/activities?start={d}&end={d}&mode=normalized",
+    "activity_detail_template": "/activities/{{activityId}}?mode=normalized",
+    "stress": "/stress?date={d}&mode=normalized",
+    "body_battery": "/body-battery?date={d}&mode=normalized",
+    "hrv": "/hrv?date={d}&mode=normalized",
+    "intensity_minutes": "/intensity-minutes?date={d}&mode=normalized",
+}
+
+
+def build_daily_links(date_str: str) -> dict[str, str]:
+    return {name: template.format(d=date_str) for name, template in _LINK_TEMPLATES.items()}
+
+
+class DailySummary(ResponseModel):
     steps: int | None = None
     calories_total_kcal: int | None = None
     calories_active_kcal: int | None = None
@@ -78,64 +99,52 @@ class DailySummary(BaseModel):
     weight_lb: float | None = None
 
 
-class DailyNormalizedResponse(BaseModel):
-    date: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
+_DAILY_EXAMPLE = {
+    "date": "2024-01-01",
+    "summary": {
+        "steps": 9342,
+        "calories_total_kcal": 2201,
+        "calories_active_kcal": 512,
+        "resting_hr_bpm": 52,
+        "sleep_seconds": 25140,
+        "sleep_score": 83,
+        "stress_avg": 28,
+        "body_battery_start": 63,
+        "body_battery_end": 18,
+        "hrv_status": "balanced",
+        "hrv_value": 68.2,
+        "intensity_minutes_moderate": 35,
+        "intensity_minutes_vigorous": 0,
+        "intensity_minutes_total": 35,
+        "weight_lb": 173.4,
+    },
+    "activities": [
+        {
+            "activityId": 123456789,
+            "type": "running",
+            "name": "Lunch Run",
+            "startTimeLocal": "2024-01-01 12:15:00",
+            "duration_s": 1800,
+            "distance_mi": 3.1,
+            "avg_speed_mph": 6.2,
+            "elevation_gain_ft": 210,
+        }
+    ],
+    "links": build_daily_links("2024-01-01"),
+}
+
+
+class DailyNormalizedResponse(ResponseModel):
+    date: DateStr
     summary: DailySummary
     activities: list[DailyActivityStub]
     links: DailyLinks
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "date": "2024-01-01",
-                    "summary": {
-                        "steps": 9342,
-                        "calories_total_kcal": 2201,
-                        "calories_active_kcal": 512,
-                        "resting_hr_bpm": 52,
-                        "sleep_seconds": 25140,
-                        "sleep_score": 83,
-                        "stress_avg": 28,
-                        "body_battery_start": 63,
-                        "body_battery_end": 18,
-                        "hrv_status": "balanced",
-                        "hrv_value": 68.2,
-                        "intensity_minutes_moderate": 35,
-                        "intensity_minutes_vigorous": 0,
-                        "intensity_minutes_total": 35,
-                        "weight_lb": 173.4,
-                    },
-                    "activities": [
-                        {
-                            "activityId": 123456789,
-                            "type": "running",
-                            "name": "Lunch Run",
-                            "startTimeLocal": "2024-01-01 12:15:00",
-                            "duration_s": 1800,
-                            "distance_mi": 3.1,
-                            "avg_speed_mph": 6.2,
-                            "elevation_gain_ft": 210,
-                        }
-                    ],
-                    "links": {
-                        "daily": "/daily?date=2024-01-01&mode=normalized",
-                        "sleep": "/sleep?date=2024-01-01&mode=normalized",
-                        "activities": "/activities?start=2024-01-01&end=2024-01-01&mode=normalized",
-                        "activity_detail_template": "/activities/{activityId}?mode=normalized",
-                        "stress": "/stress?date=2024-01-01&mode=normalized",
-                        "body_battery": "/body-battery?date=2024-01-01&mode=normalized",
-                        "hrv": "/hrv?date=2024-01-01&mode=normalized",
-                        "intensity_minutes": "/intensity-minutes?date=2024-01-01&mode=normalized",
-                    },
-                }
-            ]
-        }
-    }
+    model_config = {"json_schema_extra": {"examples": [_DAILY_EXAMPLE]}}
 
 
-class SleepResponse(BaseModel):
-    date: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
+class SleepResponse(ResponseModel):
+    date: DateStr
     sleep_seconds: int | None = None
     sleep_score: int | None = None
     deep_sleep_seconds: int | None = None
@@ -144,47 +153,47 @@ class SleepResponse(BaseModel):
     awake_seconds: int | None = None
 
 
-class StressResponse(BaseModel):
-    date: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
+class StressResponse(ResponseModel):
+    date: DateStr
     stress_avg: int | None = None
     stress_max: int | None = None
     stress_seconds: int | None = None
 
 
-class BodyBatteryResponse(BaseModel):
-    date: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
+class BodyBatteryResponse(ResponseModel):
+    date: DateStr
     body_battery_start: int | None = None
     body_battery_end: int | None = None
     body_battery_low: int | None = None
     body_battery_high: int | None = None
 
 
-class HRVResponse(BaseModel):
-    date: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
+class HRVResponse(ResponseModel):
+    date: DateStr
     hrv_status: str | None = None
     hrv_value: float | None = None
 
 
-class IntensityMinutesResponse(BaseModel):
-    date: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
+class IntensityMinutesResponse(ResponseModel):
+    date: DateStr
     intensity_minutes_moderate: int | None = None
     intensity_minutes_vigorous: int | None = None
     intensity_minutes_total: int | None = None
 
 
-class BodyWeightEntry(BaseModel):
-    date: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
+class BodyWeightEntry(ResponseModel):
+    date: DateStr
     weight_lb: float | None = None
 
 
-class BodyWeightResponse(BaseModel):
-    start: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
-    end: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
+class BodyWeightResponse(ResponseModel):
+    start: DateStr
+    end: DateStr
     latest_weight_lb: float | None = None
     weights: list[BodyWeightEntry]
 
 
-class ActivitiesListItem(BaseModel):
+class ActivitiesListItem(ResponseModel):
     activityId: int
     type: str | None = None
     name: str | None = None
@@ -196,13 +205,13 @@ class ActivitiesListItem(BaseModel):
     calories_kcal: int | None = None
 
 
-class ActivitiesListResponse(BaseModel):
-    start: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
-    end: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
+class ActivitiesListResponse(ResponseModel):
+    start: DateStr
+    end: DateStr
     activities: list[ActivitiesListItem]
 
 
-class ActivityDetailResponse(BaseModel):
+class ActivityDetailResponse(ResponseModel):
     activityId: int
     type: str | None = None
     name: str | None = None
@@ -216,5 +225,6 @@ class ActivityDetailResponse(BaseModel):
     max_hr_bpm: int | None = None
 
 
-class RawResponse(BaseModel):
-    data: dict[str, Any]
+class RawResponse(ResponseModel):
+    # Garmin payloads are passed through untouched, so skip walking the nested tree.
+    data: Any
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from typing import Sequence
+
 LB_PER_KG = 2.2046226218
 YD_PER_M = 1.0936132983
 MI_PER_M = 0.000621371192
 FT_PER_M = 3.280839895
 MPH_PER_MPS = 2.2369362921
+# Distances under a quarter mile are reported in yards; comparing in meters skips a conversion.
+YARD_THRESHOLD_M = 0.25 / MI_PER_M
 
 
 def kg_to_lb(kg: float) -> float:
@@ -27,6 +31,7 @@ def mps_to_mph(mps: float) -> float:
     return mps * MPH_PER_MPS
 
 
+# Decimal places use round(): ties follow the float's binary value, so 2.675 -> 2.67.
 def round_weight_lb(value: float) -> float:
     return round(value, 1)
 
@@ -51,8 +56,21 @@ def distance_mi_always(distance_meters: float) -> float:
     return round_distance_mi(m_to_mi(distance_meters))
 
 
-def choose_distance(distance_meters: float) -> dict[str, float | int]:
-    distance_mi = m_to_mi(distance_meters)
-    if distance_mi < 0.25:
-        return {"distance_yd": round_distance_yd(m_to_yd(distance_meters))}
-    return {"distance_mi": round_distance_mi(distance_mi)}
+def choose_distance(distance_meters: float) -> tuple[str, float | int]:
+    # (field, value) so callers can assign straight into their row dict.
+    if distance_meters < YARD_THRESHOLD_M:
+        return "distance_yd", round_distance_yd(m_to_yd(distance_meters))
+    return "distance_mi", round_distance_mi(m_to_mi(distance_meters))
+
+
+def normalize_activities_batch(
+    meters: Sequence[float | None],
+    mps: Sequence[float | None],
+    elev_m: Sequence[float | None],
+) -> dict[str, list[float | int | None]]:
+    # Column-at-a-time conversion; None entries pass through unchanged.
+    return {
+        "distance_mi": [None if value is None else round_distance_mi(value * MI_PER_M) for value in meters],
+        "avg_speed_mph": [None if value is None else round_speed_mph(value * MPH_PER_MPS) for value in mps],
+        "elevation_gain_ft": [None if value is None else int(round(value * FT_PER_M)) for value in elev_m],
+    }
@@ -7,7 +7,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
-    model_config = SettingsConfigDict(env_file=None, extra="ignore")
+    model_config = SettingsConfigDict(env_file=None, extra="ignore", frozen=True)
 
     api_key: str = Field(..., alias="API_KEY")
     token_dir: str = Field(..., alias="TOKEN_DIR")
@@ -16,6 +16,8 @@ class Settings(BaseSettings):
     tz: str = Field("UTC", alias="TZ")
     log_level: str = Field("INFO", alias="LOG_LEVEL")
     cache_ttl_seconds: int = Field(300, alias="CACHE_TTL_SECONDS")
+    cache_stale_seconds: int = Field(60, alias="CACHE_STALE_SECONDS")
+    token_refresh_interval_seconds: int = Field(3600, alias="TOKEN_REFRESH_INTERVAL_SECONDS")
     port: int = Field(8000, alias="PORT")
 
 
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
 import os
+from typing import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from helpers import API_KEY
 
 os.environ.setdefault("API_KEY", "testkey")
 os.environ.setdefault("TOKEN_DIR", "/tmp/garmin-tokens")
@@ -8,3 +14,19 @@ os.environ.setdefault("LOG_LEVEL", "INFO")
 os.environ.setdefault("CACHE_TTL_SECONDS", "1")
 os.environ.setdefault("TZ", "America/New_York")
 os.environ.setdefault("PORT", "8000")
+
+
+@pytest.fixture(scope="session")
+def client(tmp_path_factory: pytest.TempPathFactory) -> Iterator[TestClient]:
+    from app.garmin_client import get_garmin_client
+    from app.main import app
+    from app.settings import get_settings
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("API_KEY", API_KEY)
+        patch.setenv("TOKEN_DIR", str(tmp_path_factory.mktemp("tokens")))
+        get_settings.cache_clear()
+        get_garmin_client.cache_clear()
+        yield TestClient(app)
+    get_settings.cache_clear()
+    get_garmin_client.cache_clear()
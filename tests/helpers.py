@@ -0,0 +1,4 @@
+from __future__ import annotations
+
+API_KEY = "test-key"
+AUTH_HEADERS = {"X-API-Key": API_KEY}
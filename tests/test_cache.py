@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import pytest
+
+import app.cache as cache_module
+from app.cache import TTLCache, make_cache_key
+
+
+def test_make_cache_key_is_order_independent() -> None:
+    first = make_cache_key("daily", {"start": "2024-01-01", "end": "2024-01-07"}, "normalized")
+    second = make_cache_key("daily", {"end": "2024-01-07", "start": "2024-01-01"}, "normalized")
+    assert first == second
+    assert first == 'daily:normalized:v0:{"end":"2024-01-07","start":"2024-01-01"}'
+
+
+def test_bumping_cache_version_changes_keys() -> None:
+    cache = TTLCache()
+    params = {"date": "2024-01-01"}
+    old_key = make_cache_key("daily", params, "raw", cache.version)
+    cache.set(old_key, 1, ttl_seconds=60)
+
+    assert cache.bump_version() == 1
+    assert make_cache_key("daily", params, "raw", cache.version) != old_key
+
+
+def test_ttl_cache_sweeps_expired_entries_on_set(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = {"value": 1000.0}
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now["value"])
+    cache = TTLCache()
+    cache.set("a", 1, ttl_seconds=10)
+    cache.set("b", 2, ttl_seconds=60)
+
+    now["value"] += 30
+    cache.set("c", 3, ttl_seconds=60)
+
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_ttl_cache_bounds_size_by_evicting_soonest_expiry() -> None:
+    cache = TTLCache(maxsize=2)
+    cache.set("short", 1, ttl_seconds=10)
+    cache.set("long", 2, ttl_seconds=100)
+    cache.set("short", 3, ttl_seconds=200)
+    cache.set("new", 4, ttl_seconds=150)
+
+    assert len(cache) == 2
+    assert cache.get("long") is None
+    assert cache.get("short") == 3
+    assert cache.get("new") == 4
+
+
+def test_ttl_cache_keeps_stale_entries_for_get_with_meta(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = {"value": 1000.0}
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now["value"])
+    cache = TTLCache()
+    cache.set("a", 1, ttl_seconds=10, stale_seconds=20)
+
+    now["value"] += 15
+    assert cache.get("a") is None
+    assert cache.get_with_meta("a") == (1, 1010.0)
+
+    now["value"] += 20
+    assert cache.get_with_meta("a") is None
+    assert len(cache) == 0
@@ -1,34 +1,120 @@
 from __future__ import annotations
 
-from pathlib import Path
-
+import pytest
 from fastapi.testclient import TestClient
 
-from app.garmin_client import get_garmin_client
 from app.main import app
-from app.settings import get_settings
-
+from helpers import AUTH_HEADERS
 
-def _client(monkeypatch, tmp_path: Path) -> TestClient:
-    monkeypatch.setenv("API_KEY", "test-key")
-    monkeypatch.setenv("TOKEN_DIR", str(tmp_path))
-    get_settings.cache_clear()
-    get_garmin_client.cache_clear()
-    return TestClient(app)
 
-
-def test_daily_returns_needs_login(monkeypatch, tmp_path: Path) -> None:
-    client = _client(monkeypatch, tmp_path)
+def test_daily_returns_needs_login(client: TestClient) -> None:
     response = client.get(
         "/daily",
         params={"date": "2024-01-01", "mode": "normalized"},
-        headers={"X-API-Key": "test-key"},
+        headers=AUTH_HEADERS,
     )
     assert response.status_code == 503
     body = response.json()
     assert body["error"]["code"] == "needs_login"
 
 
+def test_daily_rejects_non_calendar_date_forms(client: TestClient) -> None:
+    for value in ("20240101", "2024-W01-1", "2024-02-30"):
+        response = client.get("/daily", params={"date": value}, headers=AUTH_HEADERS)
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == "invalid_date"
+
+
+def test_daily_range_reuses_cached_days(client: TestClient) -> None:
+    from app.cache import make_cache_key
+    from app.main import cache
+
+    for day in ("2024-01-01", "2024-01-02"):
+        cache.set(make_cache_key("daily", {"date": day}, "raw", cache.version), {"stats": {"day": day}}, 60)
+    response = client.get(
+        "/daily/range",
+        params={"start": "2024-01-01", "end": "2024-01-02", "mode": "raw"},
+        headers=AUTH_HEADERS,
+    )
+    assert response.status_code == 200
+    days = response.json()["days"]
+    assert days == [
+        {"stats": {"day": "2024-01-01"}, "date": "2024-01-01"},
+        {"stats": {"day": "2024-01-02"}, "date": "2024-01-02"},
+    ]
+
+
+def test_daily_range_streams_ndjson(client: TestClient) -> None:
+    import json
+
+    from app.cache import make_cache_key
+    from app.main import cache
+
+    for day in ("2024-04-01", "2024-04-02"):
+        cache.set(make_cache_key("daily", {"date": day}, "raw", cache.version), {"stats": None}, 60)
+    response = client.get(
+        "/daily/range",
+        params={"start": "2024-04-01", "end": "2024-04-02", "mode": "raw", "stream": "true"},
+        headers=AUTH_HEADERS,
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines == [
+        {"stats": None, "date": "2024-04-01"},
+        {"stats": None, "date": "2024-04-02"},
+    ]
+
+
+def test_stale_entries_are_served_while_refreshing(client: TestClient) -> None:
+    from app.cache import make_cache_key
+    from app.main import cache
+
+    params = {"start": "2024-02-01", "end": "2024-02-02", "type": None}
+    cache.set(make_cache_key("activities", params, "raw", cache.version), b'[{"activityId":1}]', 0, 60)
+    response = client.get(
+        "/activities",
+        params={"start": "2024-02-01", "end": "2024-02-02", "mode": "raw"},
+        headers=AUTH_HEADERS,
+    )
+    assert response.status_code == 200
+    assert response.json() == [{"activityId": 1}]
+
+
+def test_concurrent_cache_misses_share_one_fetch(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    import asyncio
+
+    import httpx
+
+    import app.main as main_module
+
+    calls: list[str] = []
+
+    class _SlowClient:
+        def ensure_auth_or_503(self) -> None:
+            return None
+
+        async def aget_activities(self, *_: object) -> list[dict[str, int]]:
+            calls.append("activities")
+            await asyncio.sleep(0.05)
+            return [{"activityId": 2}]
+
+    monkeypatch.setattr(main_module, "get_garmin_client", lambda: _SlowClient())
+
+    async def _run() -> list[httpx.Response]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            params = {"start": "2024-03-01", "end": "2024-03-02", "mode": "raw"}
+            return await asyncio.gather(
+                *(http.get("/activities", params=params, headers=AUTH_HEADERS) for _ in range(2))
+            )
+
+    responses = asyncio.run(_run())
+
+    assert [response.json() for response in responses] == [[{"activityId": 2}]] * 2
+    assert calls == ["activities"]
+
+
 def test_daily_schema_has_summary_object() -> None:
     from app.models import DailyNormalizedResponse
 
@@ -67,3 +153,64 @@ def test_daily_schema_has_summary_object() -> None:
     assert "summary" in payload
     assert "steps" not in payload
     assert payload["summary"]["steps"] == 100
+
+
+def test_latest_weight_matches_date_prefix() -> None:
+    from datetime import date
+
+    from app.main import _latest_weight_for_date
+
+    entries = [
+        {"date": "2024-01-01T07:00:00", "weight": 80.0},
+        {"calendarDate": "2024-01-02", "weight": 81.0},
+        {"measureDate": "2024-01-01 21:00:00", "weightInGrams": 79500},
+        {"date": "not-a-date", "calendarDate": "2024-01-01", "weight": 79.0},
+    ]
+
+    assert _latest_weight_for_date(entries, date(2024, 1, 1)) == 79.0
+    assert _latest_weight_for_date(entries[:3], date(2024, 1, 1)) == 79.5
+    assert _latest_weight_for_date(entries, date(2024, 1, 3)) is None
+
+
+def test_normalized_daily_payload_matches_response_model() -> None:
+    from datetime import date
+
+    from app.main import _normalize_daily
+    from app.models import DailyNormalizedResponse
+
+    payload = _normalize_daily(
+        date(2024, 1, 1),
+        stats={"totalSteps": 100},
+        sleep=None,
+        stress=None,
+        body_battery=None,
+        hrv=None,
+        intensity=None,
+        weight_entries=[],
+        activities=[{"activityId": 1, "activityType": "running"}],
+    )
+    model = DailyNormalizedResponse.model_validate(payload)
+
+    assert model.summary.steps == 100
+    assert model.model_dump() == payload
+
+
+def test_response_models_are_frozen_and_reject_unknown_fields() -> None:
+    from pydantic import ValidationError
+
+    from app.models import ActivityDetailResponse
+
+    model = ActivityDetailResponse.model_validate({"activityId": 1})
+
+    with pytest.raises(ValidationError):
+        model.activityId = 2
+    with pytest.raises(ValidationError):
+        ActivityDetailResponse.model_validate({"activityId": 1, "unexpected": True})
+
+
+def test_daily_schema_example_is_a_valid_payload() -> None:
+    from app.models import DailyNormalizedResponse
+
+    (example,) = DailyNormalizedResponse.model_json_schema()["examples"]
+
+    assert DailyNormalizedResponse.model_validate(example).links.daily == "/daily?date=2024-01-01&mode=normalized"
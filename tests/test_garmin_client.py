@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
 from datetime import date
 from typing import Any
 
+import pytest
+
+import app.garmin_client as gc
 from app.garmin_client import GarminClientWrapper
 
 
@@ -17,20 +23,208 @@ class _StubClient:
         return self._pages[index]
 
 
-def test_get_activities_pages_and_filters_by_date() -> None:
+def test_aget_activities_pages_and_filters_by_date(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(gc, "ACTIVITIES_PAGE_SIZE", 2)
     pages = [
         [
             {"activityId": 1, "startTimeLocal": "2025-12-27 10:00:00", "activityType": "running"},
             {"activityId": 2, "startTimeLocal": "2025-12-26 10:00:00", "activityType": "running"},
         ],
         [
-            {"activityId": 3, "startTimeLocal": "2025-12-19 10:00:00", "activityType": "running"},
+            {"activityId": 3, "startTimeLocal": "2025-12-21 10:00:00", "activityType": "running"},
+            {"activityId": 4, "startTimeLocal": "2025-12-19 10:00:00", "activityType": "running"},
         ],
     ]
     client = GarminClientWrapper.__new__(GarminClientWrapper)
     client._client = _StubClient(pages)  # type: ignore[attr-defined]
+    client._inflight = {}
 
-    result = client.get_activities(date(2025, 12, 20), date(2025, 12, 27), None)
+    result = asyncio.run(client.aget_activities(date(2025, 12, 20), date(2025, 12, 27), None))
 
     ids = [activity["activityId"] for activity in result]
-    assert ids == [1, 2]
+    assert ids == [1, 2, 3]
+
+
+class _StatsOnlyClient:
+    def get_stats(self, date_str: str) -> dict[str, Any]:
+        return {"calendarDate": date_str}
+
+
+def test_aget_daily_bundle_preserves_date_order() -> None:
+    client = GarminClientWrapper.__new__(GarminClientWrapper)
+    client._client = _StatsOnlyClient()  # type: ignore[attr-defined]
+    client._inflight = {}
+    dates = [date(2025, 12, 20), date(2025, 12, 21), date(2025, 12, 22)]
+
+    bundles = asyncio.run(client.aget_daily_bundle(dates))
+
+    assert [bundle["stats"]["calendarDate"] for bundle in bundles] == [d.isoformat() for d in dates]
+    assert bundles[0]["sleep"] is None
+    assert bundles[0]["weight_entries"] == []
+    assert bundles[0]["activities"] == []
+
+
+def test_aget_activities_stops_after_window_reaching_start() -> None:
+    pages = [
+        [{"activityId": 1, "startTimeLocal": "2025-12-27 10:00:00", "activityType": "running"}],
+        [{"activityId": 2, "startTimeLocal": "2025-12-19 10:00:00", "activityType": "running"}],
+        [{"activityId": 3, "startTimeLocal": "2025-12-12 10:00:00", "activityType": "running"}],
+    ]
+    client = GarminClientWrapper.__new__(GarminClientWrapper)
+    client._client = _StubClient(pages)  # type: ignore[attr-defined]
+    client._inflight = {}
+
+    result = asyncio.run(client.aget_activities(date(2025, 12, 20), date(2025, 12, 27), "Running"))
+
+    assert [activity["activityId"] for activity in result] == [1]
+
+
+def test_with_retries_retries_timeouts_then_returns(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(gc.time, "sleep", lambda _: None)
+    monkeypatch.setattr(gc, "GarminConnectAuthenticationError", type("_AuthError", (Exception,), {}))
+    calls: list[str] = []
+
+    def _flaky(value: str) -> str:
+        calls.append(value)
+        if len(calls) < 3:
+            raise TimeoutError("slow")
+        return value
+
+    client = GarminClientWrapper.__new__(GarminClientWrapper)
+
+    assert client._with_retries(_flaky, "ok") == "ok"
+    assert calls == ["ok", "ok", "ok"]
+
+
+def test_activity_date_accepts_space_and_t_separators() -> None:
+    assert GarminClientWrapper._activity_date({"startTimeLocal": "2024-05-12 08:33:00"}) == date(2024, 5, 12)
+    assert GarminClientWrapper._activity_date({"startTimeGMT": "2024-05-12T08:33:00.0"}) == date(2024, 5, 12)
+    assert GarminClientWrapper._activity_date({"beginTimestamp": 1715502780000}) == date(2024, 5, 12)
+
+
+class _CountingStatsClient:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def get_stats(self, date_str: str) -> dict[str, Any]:
+        self.calls += 1
+        return {"calendarDate": date_str}
+
+
+def test_concurrent_identical_fetches_share_one_upstream_call() -> None:
+    stub = _CountingStatsClient()
+    client = GarminClientWrapper.__new__(GarminClientWrapper)
+    client._client = stub  # type: ignore[attr-defined]
+    client._inflight = {}
+    target = date(2025, 12, 20)
+
+    async def _fetch_twice() -> list[Any]:
+        return list(await asyncio.gather(client.aget_daily_stats(target), client.aget_daily_stats(target)))
+
+    first, second = asyncio.run(_fetch_twice())
+
+    assert first == second == {"calendarDate": "2025-12-20"}
+    assert stub.calls == 1
+    assert client._inflight == {}
+
+
+def test_with_retries_does_not_retry_unknown_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(gc.time, "sleep", lambda _: None)
+    monkeypatch.setattr(gc, "GarminConnectAuthenticationError", type("_AuthError", (Exception,), {}))
+    monkeypatch.setattr(gc, "RETRYABLE_ERRORS", (TimeoutError,))
+    calls: list[int] = []
+
+    def _broken() -> None:
+        calls.append(1)
+        raise KeyError("boom")
+
+    client = GarminClientWrapper.__new__(GarminClientWrapper)
+
+    with pytest.raises(KeyError):
+        client._with_retries(_broken)
+    assert calls == [1]
+
+
+class _RecordingStubClient(_StubClient):
+    def __init__(self, pages: list[list[dict[str, Any]]]) -> None:
+        super().__init__(pages)
+        self.offsets: list[int] = []
+
+    def get_activities(self, offset: int, limit: int) -> list[dict[str, Any]]:
+        self.offsets.append(offset)
+        return super().get_activities(offset, limit)
+
+
+def test_aget_activities_probes_first_page_before_fanning_out(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(gc, "ACTIVITIES_PAGE_SIZE", 2)
+    short = _RecordingStubClient([[{"activityId": 1, "startTimeLocal": "2025-12-27 10:00:00"}]])
+    client = GarminClientWrapper.__new__(GarminClientWrapper)
+    client._client = short  # type: ignore[attr-defined]
+    client._inflight = {}
+
+    result = asyncio.run(client.aget_activities(date(2025, 12, 1), date(2025, 12, 27), None))
+
+    assert [activity["activityId"] for activity in result] == [1]
+    assert short.offsets == [0]
+
+    full = _RecordingStubClient(
+        [
+            [
+                {"activityId": 1, "startTimeLocal": "2025-12-27 10:00:00"},
+                {"activityId": 2, "startTimeLocal": "2025-12-26 10:00:00"},
+            ],
+            [{"activityId": 3, "startTimeLocal": "2025-12-25 10:00:00"}],
+        ]
+    )
+    client._client = full  # type: ignore[attr-defined]
+
+    result = asyncio.run(client.aget_activities(date(2025, 12, 1), date(2025, 12, 27), None))
+
+    assert [activity["activityId"] for activity in result] == [1, 2, 3]
+    assert full.offsets[0] == 0
+    assert sorted(full.offsets[1:]) == [2, 4, 6, 8]
+
+
+def test_oldest_activity_date_reads_from_the_end() -> None:
+    page = [
+        {"activityId": 1, "startTimeLocal": "2025-12-27 10:00:00"},
+        {"activityId": 2, "startTimeLocal": "2025-12-20 10:00:00"},
+        {"activityId": 3},
+    ]
+
+    assert GarminClientWrapper._oldest_activity_date(page) == date(2025, 12, 20)
+    assert GarminClientWrapper._oldest_activity_date([{"activityId": 4}]) is None
+
+
+class _SlowStatsClient:
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def get_stats(self, date_str: str) -> dict[str, Any]:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.01)
+        with self._lock:
+            self.active -= 1
+        return {"calendarDate": date_str}
+
+
+def test_upstream_calls_are_bounded_across_concurrent_bundles(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(gc, "MAX_CONCURRENT_FETCHES", 2)
+    stub = _SlowStatsClient()
+    client = GarminClientWrapper.__new__(GarminClientWrapper)
+    client._client = stub  # type: ignore[attr-defined]
+    client._inflight = {}
+
+    async def _two_ranges() -> None:
+        await asyncio.gather(
+            client.aget_daily_bundle([date(2025, 12, day) for day in range(1, 6)]),
+            client.aget_daily_bundle([date(2025, 11, day) for day in range(1, 6)]),
+        )
+
+    asyncio.run(_two_ranges())
+
+    assert stub.peak <= 2
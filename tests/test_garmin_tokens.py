@@ -68,3 +68,140 @@ def test_login_with_tokens_restore_uses_restore(monkeypatch: pytest.MonkeyPatch)
 
     assert login_called["value"] is False
     assert client._client.garth.restore_called is True
+
+
+def test_login_with_empty_tokens_skips_garmin_construction(monkeypatch: pytest.MonkeyPatch) -> None:
+    constructed = {"value": False}
+
+    def _garmin(*_: Any) -> None:
+        constructed["value"] = True
+
+    monkeypatch.setattr(gc, "Garmin", _garmin)
+    client = gc.GarminClientWrapper.__new__(gc.GarminClientWrapper)
+
+    login_called = {"value": False}
+
+    def _fake_login(self: gc.GarminClientWrapper) -> None:
+        login_called["value"] = True
+
+    monkeypatch.setattr(gc.GarminClientWrapper, "_login", _fake_login)
+    client._login_with_tokens({})
+
+    assert login_called["value"] is True
+    assert constructed["value"] is False
+
+
+def test_persist_tokens_writes_private_files(tmp_path) -> None:
+    token_dir = tmp_path / "tokens"
+    client = gc.GarminClientWrapper.__new__(gc.GarminClientWrapper)
+    client._token_dir = str(token_dir)
+    client._email = None
+    client._tokens = gc._TokenBundle(data={"access_token": "stub"})
+    client.token_last_refresh = None
+
+    client._persist_tokens()
+    client._persist_tokens()
+
+    token_file = token_dir / gc.TOKEN_BUNDLE_FILE
+    assert token_file.stat().st_mode & 0o777 == 0o600
+    assert (token_dir / gc.META_FILE).stat().st_mode & 0o777 == 0o600
+    assert token_dir.stat().st_mode & 0o777 == 0o700
+    assert client._load_tokens().data == {"access_token": "stub"}
+
+
+def test_legacy_json_tokens_are_migrated_to_bundle(tmp_path) -> None:
+    (tmp_path / gc.TOKEN_FILE).write_text("{\"access_token\": \"stub\"}", encoding="utf-8")
+    client = gc.GarminClientWrapper.__new__(gc.GarminClientWrapper)
+    client._token_dir = str(tmp_path)
+    client._email = None
+
+    assert client._load_tokens().data == {"access_token": "stub"}
+    client._persist_tokens()
+
+    assert not (tmp_path / gc.TOKEN_FILE).exists()
+    assert (tmp_path / gc.TOKEN_BUNDLE_FILE).read_bytes()[0] == gc.TOKEN_BUNDLE_VERSION
+    assert client._load_tokens().data == {"access_token": "stub"}
+
+
+def test_background_refresh_keeps_auth_on_transient_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(gc.time, "sleep", lambda _: None)
+    monkeypatch.setattr(gc, "GarminConnectAuthenticationError", type("_AuthError", (Exception,), {}))
+    client = gc.GarminClientWrapper.__new__(gc.GarminClientWrapper)
+    client._client = _StubGarminRestore("", "")
+    client._token_dir = "/tmp"
+    client._email = None
+    client._auth_status = "ok"
+
+    def _timeout(self: gc.GarminClientWrapper) -> None:
+        raise TimeoutError("slow")
+
+    monkeypatch.setattr(gc.GarminClientWrapper, "_refresh_tokens", _timeout)
+    client._background_refresh()
+
+    assert client.auth_status() == "ok"
+
+
+def test_initialize_skips_refresh_when_tokens_are_fresh(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    monkeypatch.setattr(gc, "Garmin", _StubGarminRestore)
+    writer = gc.GarminClientWrapper.__new__(gc.GarminClientWrapper)
+    writer._token_dir = str(tmp_path)
+    writer._email = None
+    writer._tokens = gc._TokenBundle(data={"access_token": "stub"})
+    writer.token_last_refresh = gc.datetime.now(gc.timezone.utc)
+    writer._persist_tokens()
+
+    refreshed = {"value": False}
+
+    def _refresh(self: gc.GarminClientWrapper) -> None:
+        refreshed["value"] = True
+
+    monkeypatch.setattr(gc.GarminClientWrapper, "_refresh_tokens", _refresh)
+    client = gc.GarminClientWrapper.__new__(gc.GarminClientWrapper)
+    client._token_dir = str(tmp_path)
+    client._email = None
+    client._password = None
+    client._refresh_interval = gc.timedelta(hours=1)
+    client._initialize_tokens()
+
+    assert refreshed["value"] is False
+    assert client.auth_status() == "ok"
+    assert client._client.garth.restore_called is True
+
+
+def test_background_refresh_logs_in_again_after_failed_login(monkeypatch: pytest.MonkeyPatch) -> None:
+    auth_error = type("_AuthError", (Exception,), {})
+    monkeypatch.setattr(gc.time, "sleep", lambda _: None)
+    monkeypatch.setattr(gc, "GarminConnectAuthenticationError", auth_error)
+    logins: list[bool] = []
+
+    class _FlakyGarmin(_StubGarminRestore):
+        def login(self) -> None:
+            logins.append(True)
+            if len(logins) == 1:
+                raise auth_error("bad credentials")
+
+    refreshed = {"value": False}
+
+    def _refresh(self: gc.GarminClientWrapper) -> None:
+        refreshed["value"] = True
+
+    monkeypatch.setattr(gc, "Garmin", _FlakyGarmin)
+    monkeypatch.setattr(gc.GarminClientWrapper, "_refresh_tokens", _refresh)
+    client = gc.GarminClientWrapper.__new__(gc.GarminClientWrapper)
+    client._client = None
+    client._token_dir = "/tmp"
+    client._email = "user@example.com"
+    client._password = "pass"
+    client._persist_tokens_from_client = lambda: None  # type: ignore[assignment]
+
+    client._try_relogin_with_creds()
+
+    assert client._client is None
+    assert client.auth_status() == "error"
+
+    client._background_refresh()
+
+    assert refreshed["value"] is False
+    assert len(logins) == 2
+    assert isinstance(client._client, _FlakyGarmin)
+    assert client.auth_status() == "ok"
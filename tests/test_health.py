@@ -1,38 +1,42 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Iterator
 
+import pytest
 from fastapi.testclient import TestClient
 
 from app.garmin_client import get_garmin_client
-from app.main import app
 from app.settings import get_settings
+from helpers import AUTH_HEADERS
 
 
-def _client(monkeypatch, tmp_path: Path) -> TestClient:
-    monkeypatch.setenv("API_KEY", "test-key")
+@pytest.fixture
+def token_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Iterator[Path]:
+    # Point the shared client at a private token dir, then drop the cached settings and client
+    # again so later tests see the session's empty one.
     monkeypatch.setenv("TOKEN_DIR", str(tmp_path))
     get_settings.cache_clear()
     get_garmin_client.cache_clear()
-    return TestClient(app)
+    yield tmp_path
+    get_settings.cache_clear()
+    get_garmin_client.cache_clear()
 
 
-def test_health_requires_api_key(monkeypatch, tmp_path: Path) -> None:
-    client = _client(monkeypatch, tmp_path)
+def test_health_requires_api_key(client: TestClient) -> None:
     response = client.get("/health")
     assert response.status_code == 401
     assert response.json()["error"]["code"] == "missing_api_key"
 
 
-def test_health_reports_tokens(monkeypatch, tmp_path: Path) -> None:
-    token_file = tmp_path / "token.json"
+def test_health_reports_tokens(client: TestClient, token_dir: Path) -> None:
+    token_file = token_dir / "token.json"
     token_file.write_text("{\"access_token\": \"stub\"}", encoding="utf-8")
-    meta_file = tmp_path / "token_meta.json"
+    meta_file = token_dir / "token_meta.json"
     meta_file.write_text("{\"last_refresh\": \"2024-01-01T12:00:00+00:00\"}", encoding="utf-8")
-    client = _client(monkeypatch, tmp_path)
-    response = client.get("/health", headers={"X-API-Key": "test-key"})
+    response = client.get("/health", headers=AUTH_HEADERS)
     assert response.status_code == 200
     payload = response.json()
     assert payload["auth"] in {"ok", "error"}
-    assert payload["token_dir"] == str(tmp_path)
+    assert payload["token_dir"] == str(token_dir)
     assert payload["token_last_refresh"] is not None
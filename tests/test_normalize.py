@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import math
+
 from app import normalize
 
 
@@ -24,23 +26,34 @@ def test_rounding_rules() -> None:
     assert normalize.round_speed_mph(5.16) == 5.2
 
 
+def test_decimal_rounding_passes_non_finite_values_through() -> None:
+    assert math.isnan(normalize.round_distance_mi(math.nan))
+    assert normalize.round_weight_lb(math.inf) == math.inf
+    assert normalize.round_speed_mph(-math.inf) == -math.inf
+
+
 def test_choose_distance_yd() -> None:
     meters = 100.0
-    payload = normalize.choose_distance(meters)
-    assert "distance_yd" in payload
-    assert "distance_mi" not in payload
-    assert payload["distance_yd"] == normalize.round_distance_yd(normalize.m_to_yd(meters))
+    field, value = normalize.choose_distance(meters)
+    assert field == "distance_yd"
+    assert value == normalize.round_distance_yd(normalize.m_to_yd(meters))
 
 
 def test_choose_distance_mi() -> None:
     meters = 1000.0
-    payload = normalize.choose_distance(meters)
-    assert "distance_mi" in payload
-    assert "distance_yd" not in payload
-    assert payload["distance_mi"] == normalize.round_distance_mi(normalize.m_to_mi(meters))
+    field, value = normalize.choose_distance(meters)
+    assert field == "distance_mi"
+    assert value == normalize.round_distance_mi(normalize.m_to_mi(meters))
 
 
 def test_distance_mi_always() -> None:
     meters = 100.0
     result = normalize.distance_mi_always(meters)
     assert result == normalize.round_distance_mi(normalize.m_to_mi(meters))
+
+
+def test_normalize_activities_batch_matches_scalar_helpers() -> None:
+    columns = normalize.normalize_activities_batch([1609.344, None], [None, 3.0], [10.0, 0.0])
+    assert columns["distance_mi"] == [normalize.distance_mi_always(1609.344), None]
+    assert columns["avg_speed_mph"] == [None, normalize.round_speed_mph(normalize.mps_to_mph(3.0))]
+    assert columns["elevation_gain_ft"] == [normalize.round_elevation_ft(normalize.m_to_ft(10.0)), 0]